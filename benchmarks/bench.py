@@ -0,0 +1,267 @@
+"""Benchmarks dos caminhos críticos: física, evolve, colisão e renderização.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench.py                      # roda e compara com o baseline
+    python benchmarks/bench.py --save-baseline      # grava um novo baseline
+    python benchmarks/bench.py --sizes 100 1000 --output results.json
+
+Tudo usa seeds fixas. A renderização roda fora da tela com o driver de vídeo
+"dummy" do SDL. Sai com código 1 se alguma métrica piorar mais que a tolerância.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'game'))
+
+from components.creature import Creature  # noqa: E402
+from components.spatial import SpatialIndex  # noqa: E402
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, FPS  # noqa: E402
+from engine import PopulationEngine  # noqa: E402
+from genetic import GeneticAlgorithm  # noqa: E402
+from seeds import spawn_rng  # noqa: E402
+
+SEED = 1234
+SIZES = (100, 1000, 10000)
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+APPLE = (SCREEN_WIDTH // 2, 50)
+DT = 1 / FPS
+
+
+def best_of(fn, repeat):
+    """Menor tempo (s) entre `repeat` execuções de `fn`"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def spread_population(n):
+    """População viva espalhada pela tela (o spawn do jogo mata quase todas nas paredes)"""
+    rng = spawn_rng(SEED, n)
+    xs = rng.uniform(10, SCREEN_WIDTH - 10, n)
+    return [Creature(x, GROUND_Y, rng=rng) for x in xs]
+
+
+def warm_up(creatures, ticks):
+    """Avança a população até ela estar se movendo/empilhando"""
+    index = SpatialIndex(max_speed=Creature.SPEED)
+    for _ in range(ticks):
+        index.rebuild(creatures)
+        for c in creatures:
+            if c.alive:
+                c.update(APPLE, SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, DT, index)
+
+
+def bench_physics(n, repeat):
+    """Ticks por segundo do `Creature.update` (com empilhamento) e do motor NumPy"""
+    ticks = max(2, 5000 // n)
+    creatures = spread_population(n)
+    warm_up(creatures, 60)
+    index = SpatialIndex(max_speed=Creature.SPEED)
+
+    def creature_ticks():
+        for _ in range(ticks):
+            index.rebuild(creatures)
+            for c in creatures:
+                if c.alive:
+                    c.update(APPLE, SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, DT, index)
+
+    engine = PopulationEngine.from_creatures(spread_population(n))
+    engine_ticks = 50
+
+    def vector_ticks():
+        for _ in range(engine_ticks):
+            engine.step(APPLE, SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, DT)
+
+    return {
+        'physics.creature.ticks_per_s': (ticks / best_of(creature_ticks, repeat), 'higher'),
+        'physics.vector.ticks_per_s': (engine_ticks / best_of(vector_ticks, repeat), 'higher'),
+    }
+
+
+def bench_evolve(n, repeat):
+    """Tempo de um `evolve()` completo (seleção, crossover, mutação e spawn)"""
+    loops = max(1, 10000 // n)
+    ga = GeneticAlgorithm(population_size=n, seed=SEED)
+    population = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    scores = spawn_rng(SEED, n).uniform(0, 100, n)
+    for c, score in zip(population, scores):
+        c.score = score
+
+    def evolve():
+        for _ in range(loops):
+            ga.evolve(population, SCREEN_WIDTH // 2, GROUND_Y)
+
+    return {'evolve.seconds': (best_of(evolve, repeat) / loops, 'lower')}
+
+
+def bench_memory(n, repeat):
+    """Pico de memória alocada (MB) durante algumas gerações de `evolve()`"""
+    ga = GeneticAlgorithm(population_size=n, seed=SEED)
+    population = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    rng = spawn_rng(SEED, n)
+    generations = 5
+
+    def run():
+        nonlocal population
+        for _ in range(generations):
+            for c, score in zip(population, rng.uniform(0, 100, n)):
+                c.score = score
+            population = ga.evolve(population, SCREEN_WIDTH // 2, GROUND_Y)
+
+    run()  # Aquece o pool de criaturas e os buffers de genomas
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'memory.evolve_peak_mb': (peak / 2 ** 20, 'lower')}
+
+
+def bench_collision(n, repeat):
+    """Custo por tick só do empilhamento: reconstruir o índice e testar quem está caindo"""
+    creatures = spread_population(n)
+    warm_up(creatures, 120)
+    index = SpatialIndex(max_speed=Creature.SPEED)
+    loops = max(1, 10000 // n)
+
+    def collide():
+        for _ in range(loops):
+            collide_once()
+
+    def collide_once():
+        index.rebuild(creatures)
+        for c in creatures:
+            if c.alive and c.vel.y > 0:
+                my_rect = c.get_collision_rect()
+                for other in index.query(c, c.dna['body_size']):
+                    if other is not c:
+                        my_rect.colliderect(other.get_collision_rect())
+
+    return {'collision.seconds_per_tick': (best_of(collide, repeat) / loops, 'lower')}
+
+
+def bench_render(n, repeat):
+    """Tempo de um frame completo fora da tela (fundo, maçã, criaturas e HUD)"""
+    import pygame
+    from components import assets
+    from components.apple import Apple
+    from components.background import Background
+    from components.platform import Platform
+    from renderer import Renderer
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    assets.preload(SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y)
+    renderer = Renderer(screen, [Background(SCREEN_WIDTH, SCREEN_HEIGHT),
+                                 Platform(GROUND_Y, SCREEN_WIDTH)])
+    apple = Apple(*APPLE)
+    font = pygame.font.Font(None, 32)
+    creatures = spread_population(n)
+    warm_up(creatures, 60)
+    frames = 30
+
+    def render():
+        for i in range(frames):
+            renderer.begin()
+            renderer.blit(apple.image, apple.rect)
+            renderer.draw_creatures(creatures)
+            renderer.text('frame', font, f"Frame: {i}", (255, 255, 255), topleft=(10, 10))
+            renderer.present()
+
+    return {'render.seconds_per_frame': (best_of(render, repeat) / frames, 'lower')}
+
+
+BENCHMARKS = {
+    'physics': bench_physics,
+    'evolve': bench_evolve,
+    'memory': bench_memory,
+    'collision': bench_collision,
+    'render': bench_render,
+}
+
+
+def run(sizes, names, repeat):
+    results = {}
+    for name in names:
+        for n in sizes:
+            for metric, (value, better) in BENCHMARKS[name](n, repeat).items():
+                results[f"{metric}[{n}]"] = {'value': value, 'better': better}
+                print(f"{metric}[{n}]: {value:.6g}", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Lista as métricas que pioraram mais que `tolerance` (fração) em relação ao baseline"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None or base['value'] == 0:
+            continue
+        ratio = result['value'] / base['value']
+        if result['better'] == 'higher':
+            worse = ratio < 1 - tolerance
+        else:
+            worse = ratio > 1 + tolerance
+        if worse:
+            regressions.append({'metric': key, 'baseline': base['value'],
+                                'value': result['value'], 'ratio': ratio})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos críticos")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="grava o JSON neste arquivo (padrão: stdout)")
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="piora relativa tolerada antes de acusar regressão")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.only, args.repeat)
+    report = {
+        'seed': SEED,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        report['regressions'] = compare(results, baseline, args.tolerance)
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if report.get('regressions'):
+        for r in report['regressions']:
+            print(f"REGRESSÃO {r['metric']}: {r['baseline']:.6g} -> {r['value']:.6g}",
+                  file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
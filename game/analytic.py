@@ -0,0 +1,231 @@
+"""Fitness sem a física completa, para criaturas que não se empilham.
+
+Uma criatura que começa parada no chão e nunca cai sobre outra segue sempre o
+mesmo roteiro: anda em direção à maçã, pula uma vez no tempo do DNA e volta
+ao chão. Esse roteiro é avançado em lote (arrays NumPy, só as criaturas
+vivas), com a mesma aritmética de `Creature.update`, então posição e score
+saem iguais bit a bit. O score é calculado uma vez, no tick em que a criatura
+morre ou no último.
+
+A cada tick também são marcadas as criaturas que chegam perto o bastante de
+outra para o empilhamento de `Creature.update` poder agir (`mark_contacts`):
+essas passam para a física completa a partir do estado do tick anterior
+(`Trajectories.states`).
+"""
+import numpy as np
+
+from engine import GENES, PopulationEngine
+
+GRAVITY = PopulationEngine.GRAVITY
+SPEED = 2  # Mesma velocidade horizontal de `Creature.SPEED`
+# Folgas do teste de contato: arredondamento e retângulos truncados para inteiros
+MARGIN = 1e-6
+RECT_SLACK = 3
+
+
+def budget_ticks(dt, budget):
+    """Ticks que cabem no orçamento (mesmo acúmulo em float do `EvaluationScheduler`)"""
+    elapsed = 0.0
+    ticks = 0
+    while elapsed < budget:
+        elapsed += dt
+        ticks += 1
+    return ticks
+
+
+def jump_ticks(jump_timing, timers):
+    """Tick (contando de 1) em que cada criatura pula; depois do último se não pular.
+
+    `timers` é o `jump_timer` no fim de cada tick (mesmo acúmulo de `+= dt`).
+    """
+    jump = np.searchsorted(timers, jump_timing, side='left') + 1
+    # No primeiro tick a criatura ainda não tocou o chão e não consegue pular
+    return np.maximum(jump, 2)
+
+
+def _ranges(points, x, radius):
+    """Início e fim, em `points` ordenado, dos pontos a menos de `radius` de cada `x`"""
+    lo = np.searchsorted(points, x - radius, side='right')
+    hi = np.searchsorted(points, x + radius, side='left')
+    return lo, hi
+
+
+def _gather(owners, lo, hi):
+    """Donos dos pontos nas faixas [lo, hi) (concatenadas)"""
+    lengths = hi - lo
+    total = int(lengths.sum())
+    if not total:
+        return owners[:0]
+    starts = np.repeat(lo - np.cumsum(lengths) + lengths, lengths)
+    return owners[starts + np.arange(total)]
+
+
+def head_score(x, y, total_height, target_pos):
+    """Mesma pontuação de `PopulationEngine.step` para as posições dadas"""
+    tx, ty = np.asarray(target_pos, dtype=np.float64).T
+    head_dx = tx - x
+    head_dy = ty - (y - total_height)
+    dist = np.sqrt(head_dx * head_dx + head_dy * head_dy)
+    score = np.maximum(0, 200 / (dist + 1))
+    score += np.where(dist < 50, 50, 0)
+    score += np.where(dist < 20, 100, 0)
+    score -= np.where(dist > 300, 10, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dir_y = np.where(dist > 0, head_dy / dist, 0.0)
+    score += np.where(dir_y < -0.5, 10, 0)
+    return np.maximum(0, score)
+
+
+class Trajectories:
+    """Criaturas que começam paradas em `ground_y`, avançadas em lote.
+
+    `genes` é a matriz N x len(GENES) e `x` a posição inicial de cada uma;
+    `target_pos` é a maçã (x, y) ou um array (N, 2). `advance` calcula o
+    próximo tick e `commit` o aplica: entre os dois, o estado do tick anterior
+    continua disponível em `states` e `remove` tira criaturas que passam a ser
+    simuladas de outro jeito.
+    """
+    def __init__(self, genes, x, target_pos, dt, budget, width, ground_y):
+        genes = np.asarray(genes, dtype=np.float64).reshape(-1, len(GENES))
+        n = len(genes)
+        leg, neck, body, strength, timing = genes.T
+        self.body = body
+        self.total_height = leg + body + neck
+        # Mesma conta de `Creature.jump` (massa somada na ordem de `Creature.dna`)
+        self.jump_force = strength / np.sqrt((body + leg + neck) / 15)
+        self.tx, self.ty = np.broadcast_to(np.asarray(target_pos, dtype=np.float64), (n, 2)).T
+        self.width = width
+        self.ground_y = ground_y
+
+        self.total_ticks = budget_ticks(dt, budget)
+        self.timers = np.cumsum(np.full(self.total_ticks, dt))
+        self.jump = jump_ticks(timing, self.timers)
+
+        self.x = np.array(x, dtype=np.float64)
+        self.y = np.full(n, float(ground_y))
+        self.vel_y = np.zeros(n)
+        self.in_air = np.zeros(n, dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+        self.idx = np.arange(n)  # Vivas (e ainda acompanhadas aqui)
+        self.tick = 0
+        self._next = None
+
+    def advance(self):
+        """Calcula o próximo tick sem aplicar; retorna o estado das vivas.
+
+        O estado é (ids, x antes, x depois, y antes, y depois, no ar, body_size,
+        altura), no formato de `mark_contacts`.
+        """
+        tick = self.tick + 1
+        idx = self.idx
+        x_before = self.x[idx]
+        y_before = self.y[idx]
+
+        # Passo horizontal a partir da posição no começo do tick
+        dx = self.tx[idx] - x_before
+        dy = self.ty[idx] - y_before
+        length = np.sqrt(dx * dx + dy * dy)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            x_after = x_before + np.where(length > 0, dx / length, 0.0) * SPEED
+
+        # Pulo, gravidade e chão como em `Creature.update`
+        jumping = self.jump[idx] == tick
+        in_air = self.in_air[idx] | jumping
+        vel_y = np.where(jumping, -self.jump_force[idx], self.vel_y[idx])
+        vel_y = np.where(in_air, np.minimum(vel_y + GRAVITY, PopulationEngine.MAX_FALL_SPEED),
+                         vel_y)
+        y_after = np.where(in_air, y_before + vel_y, self.ground_y)
+        landed = in_air & (y_after >= self.ground_y)
+        y_after[landed] = self.ground_y
+        vel_y[landed] = 0
+        in_air &= ~landed
+
+        # Só as paredes matam: sem empilhamento ninguém passa do chão
+        died = (x_after < 0) | (x_after > self.width)
+        self._next = (x_after, y_after, vel_y, in_air, died)
+        return (idx, x_before, x_after, y_before, y_after, in_air, self.body[idx],
+                self.total_height[idx])
+
+    def commit(self):
+        """Aplica o tick calculado por `advance`"""
+        x_after, y_after, vel_y, in_air, died = self._next
+        self._next = None
+        self.tick += 1
+        idx = self.idx
+        self.x[idx] = x_after
+        self.y[idx] = y_after
+        self.vel_y[idx] = vel_y
+        self.in_air[idx] = in_air
+        if died.any():
+            self.alive[idx[died]] = False
+            self.idx = idx[~died]
+
+    def remove(self, ids):
+        """Deixa de acompanhar `ids` (inclusive no tick pendente de `advance`)"""
+        keep = ~np.isin(self.idx, ids)
+        self.idx = self.idx[keep]
+        if self._next is not None:
+            self._next = tuple(a[keep] for a in self._next)
+
+    def states(self, ids):
+        """Estado das criaturas `ids` no fim do último tick aplicado, como em `Creature`"""
+        tick = self.tick
+        timer = float(self.timers[tick - 1]) if tick else 0
+        has_jumped = (tick >= self.jump[ids]).tolist()
+        in_air = self.in_air[ids].tolist()
+        score = head_score(self.x[ids], self.y[ids], self.total_height[ids],
+                           np.stack([self.tx[ids], self.ty[ids]], axis=1)).tolist()
+        return [{
+            'x': x,
+            'y': y,
+            'vel_y': vel_y,
+            'jump_timer': timer,
+            'has_jumped': jumped,
+            'on_ground': tick > 0 and not air,
+            'can_jump': not (jumped and air),
+            'alive': alive,
+            # `max(0, score)` de `Creature.update` é o 0 inteiro (e antes do 1º tick também)
+            'score': s if tick and s > 0 else 0,
+        } for x, y, vel_y, jumped, air, alive, s in zip(
+            self.x[ids].tolist(), self.y[ids].tolist(), self.vel_y[ids].tolist(), has_jumped,
+            in_air, self.alive[ids].tolist(), score)]
+
+    def scores(self):
+        """Score de cada criatura no tick em que morreu (ou no último)"""
+        return head_score(self.x, self.y, self.total_height,
+                          np.stack([self.tx, self.ty], axis=1))
+
+
+def mark_contacts(contact, owner, x_before, x_after, y_before, y_after, falling,
+                  fall_low, fall_high, body, height):
+    """Marca em `contact` as criaturas (ids >= 0) que podem se empilhar neste tick.
+
+    Como no teste de `Creature.update`, quem cai sobre outra está caindo, a
+    menos de `body_size` (o seu) dela na horizontal, acima dela e com os
+    retângulos se tocando. A outra pode estar na posição do começo ou do fim
+    do tick (depende da ordem de atualização), então as duas contam; a altura
+    de quem cai no momento do teste está entre `fall_low` e `fall_high`.
+    Criaturas com id negativo entram no teste, mas não são marcadas.
+    """
+    falling = np.flatnonzero(falling)
+    if not len(falling):
+        return
+
+    # Posições de todos no começo e no fim do tick, ordenadas em x
+    px = np.concatenate([x_after, x_before])
+    order = np.argsort(px, kind='stable')
+    px = px[order]
+    point = np.concatenate([np.arange(len(owner))] * 2)[order]
+    py = np.concatenate([y_after, y_before])[order]
+
+    lo, hi = _ranges(px, x_after[falling], body[falling] + MARGIN)
+    faller = np.repeat(falling, hi - lo)
+    near = _gather(np.arange(len(px)), lo, hi)
+    other = point[near]
+    py = py[near]
+    # Retângulos inteiros (truncados): a base de quem cai passa do topo da outra
+    keep = ((owner[faller] != owner[other])
+            & (fall_low[faller] < py + MARGIN)
+            & (fall_high[faller] > py - height[other] - RECT_SLACK))
+    ids = np.concatenate([owner[faller[keep]], owner[other[keep]]])
+    contact[ids[ids >= 0]] = True
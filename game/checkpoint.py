@@ -0,0 +1,66 @@
+"""Checkpoint binário compacto do algoritmo genético.
+
+Layout do arquivo (little-endian):
+    cabeçalho | histórico de fitness (float64) | metadados JSON | padding | genomas (float64)
+
+O bloco de genomas começa alinhado em `ALIGNMENT` bytes para poder ser
+mapeado em memória (`np.memmap`) sem copiar.
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b'GACP'
+VERSION = 1
+ALIGNMENT = 64
+
+# magic, versão, genes por genoma, população, geração, tamanho do histórico,
+# tamanho dos metadados, offset dos genomas
+HEADER = struct.Struct('<4sHHQQQQQ')
+
+
+def save(path, genomes, generation, history, meta):
+    """Grava o checkpoint de forma atômica (arquivo temporário + rename)"""
+    genomes = np.ascontiguousarray(genomes, dtype='<f8')
+    history = np.asarray(history, dtype='<f8')
+    meta_bytes = json.dumps(meta, separators=(',', ':')).encode()
+
+    data_offset = HEADER.size + history.nbytes + len(meta_bytes)
+    genome_offset = -(-data_offset // ALIGNMENT) * ALIGNMENT
+    header = HEADER.pack(MAGIC, VERSION, genomes.shape[1], genomes.shape[0], generation,
+                         len(history), len(meta_bytes), genome_offset)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(history.tobytes())
+        f.write(meta_bytes)
+        f.write(b'\0' * (genome_offset - data_offset))
+        f.write(genomes.tobytes())
+    os.replace(tmp_path, path)
+
+
+def load(path, mmap=False):
+    """Lê o checkpoint, retorna (genomas, geração, histórico, metadados)"""
+    with open(path, 'rb') as f:
+        (magic, version, n_genes, population_size, generation, history_len,
+         meta_len, genome_offset) = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} não é um checkpoint")
+        if version != VERSION:
+            raise ValueError(f"Versão de checkpoint não suportada: {version}")
+
+        history = np.frombuffer(f.read(history_len * 8), dtype='<f8').tolist()
+        meta = json.loads(f.read(meta_len))
+
+        shape = (population_size, n_genes)
+        if mmap:
+            # Cópia na escrita: o arquivo nunca é alterado
+            genomes = np.memmap(path, dtype='<f8', mode='c', offset=genome_offset, shape=shape)
+        else:
+            f.seek(genome_offset)
+            genomes = np.fromfile(f, dtype='<f8', count=population_size * n_genes).reshape(shape)
+
+    return genomes, generation, history, meta
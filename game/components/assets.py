@@ -0,0 +1,64 @@
+import pygame
+from collections import OrderedDict
+
+# Caminhos dos assets (relativos à raiz do repositório)
+APPLE_IMAGE = "game/assets/apple.png"
+CROWN_IMAGE = "game/assets/crown.png"
+GROUND_IMAGE = "game/assets/ground.png"
+BACKGROUND_LAYERS = [f"game/assets/background/plx-{i}.png" for i in range(1, 6)]
+
+
+class AssetCache:
+    """Cache LRU de imagens carregadas e redimensionadas, chave (caminho, tamanho, alpha)"""
+    def __init__(self, max_items=64):
+        self.max_items = max_items
+        self._surfaces = OrderedDict()
+
+    def get(self, path, size=None, alpha=True):
+        """Retorna a superfície do cache, carregando/redimensionando só na primeira vez"""
+        key = (path, tuple(size) if size is not None else None, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        if size is None:
+            image = pygame.image.load(path)
+            surface = image.convert_alpha() if alpha else image.convert()
+        else:
+            # Reaproveita a imagem original do cache para redimensionar
+            surface = pygame.transform.scale(self.get(path, None, alpha), key[1])
+
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self.max_items:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def preload(self, entries):
+        """Carrega de antemão uma lista de (caminho, tamanho, alpha)"""
+        for path, size, alpha in entries:
+            self.get(path, size, alpha)
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# Cache compartilhado por todos os componentes
+assets = AssetCache()
+
+
+def load_image(path, size=None, alpha=True):
+    return assets.get(path, size, alpha)
+
+
+def preload(width, height, ground_y):
+    """Pré-carrega os assets usados no início do jogo"""
+    assets.preload(
+        [(path, (width, height), i > 0) for i, path in enumerate(BACKGROUND_LAYERS)]
+        + [(APPLE_IMAGE, (50, 50), True),
+           (GROUND_IMAGE, (width * 2, 200), True),
+           (CROWN_IMAGE, (30, 30), True)]
+    )
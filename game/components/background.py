@@ -1,17 +1,13 @@
-import pygame
+from components.assets import BACKGROUND_LAYERS, load_image
 
 class Background:
     def __init__(self, width, height):
-        # Carregar camadas
+        # Carregar camadas (a primeira é opaca)
         self.layers = [
-            pygame.image.load("game/assets/background/plx-1.png").convert(),
-            pygame.image.load("game/assets/background/plx-2.png").convert_alpha(),
-            pygame.image.load("game/assets/background/plx-3.png").convert_alpha(),
-            pygame.image.load("game/assets/background/plx-4.png").convert_alpha(),
-            pygame.image.load("game/assets/background/plx-5.png").convert_alpha(),
+            load_image(path, (width, height), alpha=(i > 0))
+            for i, path in enumerate(BACKGROUND_LAYERS)
         ]
-        self.layers = [pygame.transform.scale(item, (width, height)) for item in self.layers]
 
     def draw(self, screen):
         for layer in self.layers:
-            screen.blit(layer, (0, 0))
\ No newline at end of file
+            screen.blit(layer, (0, 0))
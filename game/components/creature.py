@@ -1,59 +1,163 @@
-import pygame
-import random
 import math
+from components.geometry import Rect, Vec2
+from components.spatial import SpatialIndex
+from genome import Genome
+from seeds import DEFAULT_RNG
 
 class Creature:
-    def __init__(self, x, y, dna=None):
-        self.pos = pygame.Vector2(x, y)
-        self.vel = pygame.Vector2(random.uniform(-0.5, 0.5), 0)
-        self.alive = True
-        self.score = 0
+    SPEED = 2  # Velocidade horizontal máxima
+
+    __slots__ = ('pos', 'prev_pos', 'vel', '_alive', '_score', 'on_ground', 'can_jump', 'standing_on',
+                 'jump_timer', 'has_jumped', 'is_best', '_dna', '_body_size',
+                 '_total_height', '_mass', '_jump_timing', '_rect', '_rect_key', '_sprite',
+                 '_tracker', '_index', 'frozen', '_still_ticks', '_last_state', '_support')
+
+    def __init__(self, x, y, dna=None, rng=None):
+        rng = rng or DEFAULT_RNG
+        self.pos = Vec2(x, y)
+        self.prev_pos = Vec2(x, y)  # Posição no tick anterior (interpolação)
+        self.vel = Vec2(rng.uniform(-0.5, 0.5), 0)
+        self._alive = True
+        self._score = 0
+        # Tracker de estatísticas da população (avisado quando score/alive mudam)
+        self._tracker = None
+        self._index = 0
         self.on_ground = False
         self.can_jump = True
         self.standing_on = None  # Outra criatura
+        # Última criatura em que encostou por cima (vale até voltar ao chão ou
+        # pular: parada sobre outra, ela quica e `standing_on` só vale no encosto)
+        self._support = None
         
-        # DNA: genes da criatura
+        # DNA: genes da criatura (linha da matriz de genomas da população)
         if dna is None:
-            self.dna = {
-                'leg_length': random.uniform(10, 30),
-                'neck_length': random.uniform(7.5, 40),
-                'body_size': random.uniform(7.5, 17.5),
-                'jump_strength': random.uniform(2, 15),
-                'color': (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255)),
-                'jump_timing': random.uniform(1, 3.0)  # Quando pular em segundos
-            }
+            self.dna = Genome.random(rng=rng)
         else:
             self.dna = dna
         
         self.jump_timer = 0
         self.has_jumped = False
         self.is_best = False  # Indica se a criatura é a melhor
+
+        # Criatura parada com score estável: `update` deixa de simulá-la
+        self.frozen = False
+        self._still_ticks = 0
+        self._last_state = None
+
+        # Cache do retângulo de colisão (só muda quando a posição muda)
+        self._rect = None
+        self._rect_key = None
         
+    def reset(self, x, y, data, rng=None):
+        """Reaproveita a criatura para a próxima geração, sem alocar nada.
+
+        Volta ao estado de uma criatura recém-criada em (x, y) com o genoma da
+        linha `data` (o objeto `Genome` é reutilizado) e consome o `rng` na
+        mesma ordem do construtor. O tracker é desligado até o próximo
+        `track`, e `standing_on` é limpo (nenhuma referência à geração antiga).
+        """
+        rng = rng or DEFAULT_RNG
+        self.pos.update(x, y)
+        self.prev_pos.update(x, y)
+        self.vel.update(rng.uniform(-0.5, 0.5), 0)
+        self._tracker = None
+        self._index = 0
+        self._alive = True
+        self._score = 0
+        self.on_ground = False
+        self.can_jump = True
+        self.standing_on = None
+        self._support = None
+
+        self._dna.data = data
+        self.dna = self._dna  # Recalcula os derivados e o sprite
+
+        self.jump_timer = 0
+        self.has_jumped = False
+        self.is_best = False
+        self.frozen = False
+        self._still_ticks = 0
+        self._last_state = None
+        self._rect_key = None
+
+    @property
+    def dna(self):
+        return self._dna
+
+    @dna.setter
+    def dna(self, dna):
+        if isinstance(dna, dict):
+            dna = Genome.from_dict(dna)
+        self._dna = dna
+        self._sprite = None
+
+        # Os genes não mudam durante a vida da criatura, então guarda os derivados
+        leg_length, neck_length, body_size, _, jump_timing = dna.data[:5].tolist()
+        self._body_size = body_size
+        self._total_height = leg_length + body_size + neck_length
+        self._mass = (body_size + leg_length + neck_length) / 15
+        self._jump_timing = jump_timing
+
+    @property
+    def score(self):
+        return self._score
+
+    @score.setter
+    def score(self, score):
+        if self._tracker is not None:
+            self._tracker.update_score(self._index, score)
+        self._score = score
+
+    @property
+    def alive(self):
+        return self._alive
+
+    @alive.setter
+    def alive(self, alive):
+        if self._tracker is not None:
+            self._tracker.update_alive(self._index, alive)
+        self._alive = alive
+
+    def track(self, tracker, index):
+        """Liga a criatura a um PopulationStats (na posição `index`)"""
+        self._tracker = tracker
+        self._index = index
+
     @property
     def mass(self):
         """Massa baseada no tamanho total"""
-        return (self.dna['body_size'] + self.dna['leg_length'] + self.dna['neck_length']) / 15
+        return self._mass
     
     @property
     def total_height(self):
         """Altura total da criatura"""
-        return self.dna['leg_length'] + self.dna['body_size'] + self.dna['neck_length']
+        return self._total_height
     
+    def draw_pos(self, alpha=1.0):
+        """Posição interpolada entre o tick anterior e o atual (`alpha` de 0 a 1)"""
+        if alpha >= 1.0:
+            return self.pos
+        return self.prev_pos.lerp(self.pos, alpha)
+
     @property
     def head_pos(self):
         """Posição da cabeça"""
-        return pygame.Vector2(self.pos.x, self.pos.y - self.total_height)
+        return Vec2(self.pos.x, self.pos.y - self.total_height)
     
     def get_collision_rect(self):
         """Retângulo de colisão para empilhamento"""
-        width = self.dna['body_size'] * 1.5
-        height = self.total_height
-        return pygame.Rect(
-            self.pos.x - width/2,
-            self.pos.y - height,
-            width,
-            height
-        )
+        key = (self.pos.x, self.pos.y)
+        if key != self._rect_key:
+            width = self._body_size * 1.5
+            height = self.total_height
+            self._rect = Rect(
+                self.pos.x - width/2,
+                self.pos.y - height,
+                width,
+                height
+            )
+            self._rect_key = key
+        return self._rect
 
     def jump(self):
         """Pula considerando massa e força"""
@@ -63,28 +167,80 @@ class Creature:
             self.vel.y = -jump_force
             self.on_ground = False
             self.standing_on = None
+            self._support = None
             self.can_jump = False
             self.has_jumped = True
+            # Volta a se mover, então volta a ser simulada
+            self.frozen = False
+            self._still_ticks = 0
+
+    def save_state(self):
+        """Estado que um tick de `update` muda (sem fim antecipado), para `restore_state`"""
+        return (self.pos.x, self.pos.y, self.prev_pos.x, self.prev_pos.y, self.vel.x,
+                self.vel.y, self.jump_timer, self.has_jumped, self.on_ground, self.can_jump,
+                self.standing_on, self._support, self._alive, self._score)
+
+    def restore_state(self, state):
+        """Desfaz os ticks dados desde `save_state`"""
+        (x, y, prev_x, prev_y, vel_x, vel_y, self.jump_timer, self.has_jumped,
+         self.on_ground, self.can_jump, self.standing_on, self._support, alive, score) = state
+        self.pos.update(x, y)
+        self.prev_pos.update(prev_x, prev_y)
+        self.vel.update(vel_x, vel_y)
+        # Pelos setters: o tracker também volta
+        self.alive = alive
+        self.score = score
+
+    def settle(self, patience, epsilon, move_epsilon):
+        """Congela a criatura se ficou parada com score estável por `patience` ticks.
+
+        Parada é no chão ou em cima de uma criatura já congelada (que não se
+        move mais).
+        """
+        state = (self._score, self.pos.x)
+        last = self._last_state
+        support = self._support
+        on_frozen = not self.on_ground and support is not None and support.frozen
+        if on_frozen and self.standing_on is None:
+            # Quicando entre dois encostos na criatura de baixo: só compara no
+            # encosto, mas o tempo conta
+            if self._still_ticks:
+                self._still_ticks += 1
+            return self.frozen
+        if (last is not None and (self.on_ground or on_frozen) and self.has_jumped
+                and abs(state[0] - last[0]) <= epsilon
+                and abs(state[1] - last[1]) <= move_epsilon):
+            self._still_ticks += 1
+        else:
+            self._still_ticks = 0
+        self._last_state = state
+        if self._still_ticks >= patience:
+            self.frozen = True
+        return self.frozen
 
     def update(self, target_pos, width, height, ground_y, delta_time, other_creatures):
         if not self.alive:
             return
+        self.prev_pos.update(self.pos)
+        if self.frozen:
+            return
 
-        # Direção para a maçã (movimento direcionado)
-        direction_to_target = pygame.Vector2(target_pos) - self.pos
-        if direction_to_target.length() > 0:
-            direction_to_target = direction_to_target.normalize()
-        else:
-            direction_to_target = pygame.Vector2(0, 0)
+        # Direção para a maçã (movimento direcionado), em escalares para não
+        # criar vetores temporários a cada tick
+        target_x, target_y = target_pos
+        dx = target_x - self.pos.x
+        dy = target_y - self.pos.y
+        length = math.sqrt(dx * dx + dy * dy)
+        direction_x = dx / length if length > 0 else 0.0
 
         # Ajusta a velocidade para seguir a direção da maçã
-        self.vel.x = direction_to_target.x * 2  # Velocidade horizontal ajustada
+        self.vel.x = direction_x * self.SPEED  # Velocidade horizontal ajustada
 
         # Timer para pulo automático
         self.jump_timer += delta_time
 
         # Pula no tempo definido pelo DNA
-        if not self.has_jumped and self.jump_timer >= self.dna['jump_timing']:
+        if not self.has_jumped and self.jump_timer >= self._jump_timing:
             self.jump()
 
         # Gravidade
@@ -108,15 +264,19 @@ class Creature:
         # Verifica empilhamento com outras criaturas
         self.standing_on = None
         if self.vel.y > 0:  # Caindo
+            # Com um índice espacial só olha as criaturas próximas
+            if isinstance(other_creatures, SpatialIndex):
+                other_creatures = other_creatures.query(self, self._body_size)
+
+            my_rect = self.get_collision_rect()
             for other in other_creatures:
                 if other != self and other.alive:
                     other_rect = other.get_collision_rect()
-                    my_rect = self.get_collision_rect()
 
                     # Se estou caindo sobre outra criatura
                     if (my_rect.colliderect(other_rect) and 
                         self.pos.y < other.pos.y and
-                        abs(self.pos.x - other.pos.x) < self.dna['body_size']):
+                        abs(self.pos.x - other.pos.x) < self._body_size):
 
                         # Fica em cima da outra criatura
                         self.pos.y = other.pos.y - other.total_height - 5
@@ -125,6 +285,11 @@ class Creature:
                         self.can_jump = True
                         break
 
+        if self.standing_on is not None:
+            self._support = self.standing_on
+        elif self.on_ground:
+            self._support = None
+
         # Colisão com as paredes
         if self.pos.x < 0 or self.pos.x > width:
             self.alive = False
@@ -134,77 +299,50 @@ class Creature:
             self.alive = False
 
         # Calcula pontuação (distância da cabeça até a maçã)
-        head_pos = self.head_pos
-        dist = head_pos.distance_to(target_pos)
-        self.score = max(0, 200 / (dist + 1))  # Ajusta o fator de pontuação para maior variação
+        # Conta numa variável local e atribui uma vez só (o setter avisa o tracker)
+        head_dx = target_x - self.pos.x
+        head_dy = target_y - (self.pos.y - self._total_height)
+        dist = math.sqrt(head_dx * head_dx + head_dy * head_dy)
+        score = max(0, 200 / (dist + 1))  # Ajusta o fator de pontuação para maior variação
 
         # Bônus por chegar perto
         if dist < 50:
-            self.score += 50  # Aumenta o bônus para encorajar aproximação
+            score += 50  # Aumenta o bônus para encorajar aproximação
         if dist < 20:
-            self.score += 100
+            score += 100
 
         # Penalidade por ficar muito longe
         if dist > 300:
-            self.score -= 10  # Penalidade leve para criaturas muito distantes
+            score -= 10  # Penalidade leve para criaturas muito distantes
 
-        try:
-            dir_vec = (pygame.Vector2(target_pos) - head_pos)
-            if dir_vec.length() > 0:
-                dir_norm = dir_vec.normalize()
-            else:
-                dir_norm = pygame.Vector2(0, 0)
+        # Bônus adicional para criaturas que se movem na direção correta
+        if dist > 0 and head_dy / dist < -0.5:
+            score += 10  # Incentiva pular
 
-            # Bônus adicional para criaturas que se movem na direção correta
-            if dir_norm.y < -0.5:
-                self.score += 10  # Incentiva pular
-        except Exception:
-            pass
+        self.score = max(0, score)
 
-        self.score = max(0, self.score)
+    @property
+    def sprite(self):
+        """Sprite pré-renderizado (compartilhado entre DNAs quase iguais)"""
+        if self._sprite is None:
+            # Importado só quando algo é desenhado (o resto não depende do pygame)
+            from components.sprites import sprites
+            self._sprite = sprites.get(self.dna)
+        return self._sprite
 
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         if not self.alive:
             return
 
-        color = self.dna['color']
-
-        # Pernas (duas linhas)
-        leg_width = 4
-        leg_spacing = self.dna['body_size'] * 0.6
-        left_leg_x = self.pos.x - leg_spacing / 2
-        right_leg_x = self.pos.x + leg_spacing / 2
-        leg_bottom_y = self.pos.y
-        leg_top_y = self.pos.y - self.dna['leg_length']
-
-        pygame.draw.line(screen, color, (left_leg_x, leg_bottom_y), (left_leg_x, leg_top_y), leg_width)
-        pygame.draw.line(screen, color, (right_leg_x, leg_bottom_y), (right_leg_x, leg_top_y), leg_width)
-
-        # Corpo (círculo)
-        body_y = self.pos.y - self.dna['leg_length'] - self.dna['body_size']/2
-        pygame.draw.circle(screen, color, (int(self.pos.x), int(body_y)), int(self.dna['body_size']/2))
-
-        # Pescoço (linha)
-        neck_bottom_y = body_y - self.dna['body_size']/2
-        neck_top_y = neck_bottom_y - self.dna['neck_length']
-        pygame.draw.line(screen, color, (self.pos.x, neck_bottom_y), (self.pos.x, neck_top_y), 4)
-
-        # Cabeça (círculo menor)
-        head_size = 8
-        head_pos = self.head_pos
-        pygame.draw.circle(screen, color, (int(head_pos.x), int(head_pos.y)), head_size)
-
-        # Olhos
-        pygame.draw.circle(screen, (0, 0, 0), (int(head_pos.x - 3), int(head_pos.y - 1)), 2)
-        pygame.draw.circle(screen, (0, 0, 0), (int(head_pos.x + 3), int(head_pos.y - 1)), 2)
+        # Um único blit do sprite em cache
+        surface, (ox, oy) = self.sprite
+        pos = self.draw_pos(alpha)
+        screen.blit(surface, (int(pos.x) - ox, int(pos.y) - oy))
 
         # Desenha coroa se for a melhor criatura
         if self.is_best:
-            crown_image = pygame.image.load("game/assets/crown.png").convert_alpha()
-            crown_image = pygame.transform.scale(crown_image, (30, 30))
-            crown_x = int(head_pos.x - 15)  # Centraliza a coroa
-            crown_y = int(head_pos.y - 40)  # Posiciona acima da cabeça
-            screen.blit(crown_image, (crown_x, crown_y))
+            from components.sprites import draw_crown
+            draw_crown(screen, self, alpha)
 
         # Desenha retângulo de debug (descomente para ver colisão)
         # pygame.draw.rect(screen, (255, 0, 0), self.get_collision_rect(), 1)
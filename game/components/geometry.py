@@ -0,0 +1,107 @@
+"""Vetor 2D e retângulo mínimos para a física, sem depender do pygame.
+
+Só o necessário para `Creature`: o núcleo da simulação (GA, headless,
+workers) importa sem pygame e sem display. A semântica segue a do pygame
+(`Rect` trunca as coordenadas para inteiros e retângulos vazios não colidem),
+então os resultados não mudam.
+"""
+import math
+
+
+class Vec2:
+    """Vetor 2D de floats (subconjunto de `pygame.Vector2`)"""
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x=0.0, y=None):
+        if y is None:
+            # Como o pygame: Vec2((x, y)), Vec2(v) ou Vec2(a) == Vec2(a, a)
+            x, y = (x, x) if isinstance(x, (int, float)) else x
+        self.x = x
+        self.y = y
+
+    def update(self, x, y=None):
+        """Copia outro vetor (`update(v)`) ou define as duas coordenadas"""
+        if y is None:
+            x, y = x
+        self.x = x
+        self.y = y
+
+    def copy(self):
+        return Vec2(self.x, self.y)
+
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    def normalize(self):
+        length = self.length()
+        if length == 0:
+            raise ValueError("não dá para normalizar um vetor de tamanho zero")
+        return Vec2(self.x / length, self.y / length)
+
+    def distance_to(self, other):
+        dx = self.x - other[0]
+        dy = self.y - other[1]
+        return math.sqrt(dx * dx + dy * dy)
+
+    def lerp(self, other, t):
+        return Vec2(self.x + (other.x - self.x) * t, self.y + (other.y - self.y) * t)
+
+    def __iadd__(self, other):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __add__(self, other):
+        return Vec2(self.x + other[0], self.y + other[1])
+
+    def __sub__(self, other):
+        return Vec2(self.x - other[0], self.y - other[1])
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, i):
+        return (self.x, self.y)[i]
+
+    def __eq__(self, other):
+        try:
+            return self.x == other[0] and self.y == other[1] and len(other) == 2
+        except (TypeError, IndexError):
+            return NotImplemented
+
+    def __repr__(self):
+        return f"Vec2({self.x}, {self.y})"
+
+
+class Rect:
+    """Retângulo de inteiros (x, y, largura, altura) com `colliderect` do pygame"""
+    __slots__ = ('x', 'y', 'w', 'h')
+
+    def __init__(self, x, y, w, h):
+        # Como o pygame: trunca para inteiros
+        self.x = int(x)
+        self.y = int(y)
+        self.w = int(w)
+        self.h = int(h)
+
+    def colliderect(self, other):
+        """Se os dois se sobrepõem (encostar na borda ou ter tamanho 0 não conta)"""
+        return (self.w > 0 and self.h > 0 and other.w > 0 and other.h > 0
+                and self.x < other.x + other.w and other.x < self.x + self.w
+                and self.y < other.y + other.h and other.y < self.y + self.h)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.w, self.h))
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.w, self.h)[i]
+
+    def __repr__(self):
+        return f"Rect({self.x}, {self.y}, {self.w}, {self.h})"
@@ -1,9 +1,8 @@
-import pygame
+from components.assets import GROUND_IMAGE, load_image
 
 class Platform():
     def __init__(self, x, y):
-        self.image = pygame.image.load("game/assets/ground.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (y * 2, 200))
+        self.image = load_image(GROUND_IMAGE, (y * 2, 200))
         # self.rect = pygame.Rect(x, y, width, height)
         self.rect = self.image.get_rect(center=(0, x + 100))
     def draw(self, screen):
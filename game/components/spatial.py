@@ -0,0 +1,33 @@
+from bisect import bisect_left, bisect_right
+
+
+class SpatialIndex:
+    """Índice espacial (varredura ordenada em x) para o empilhamento das criaturas.
+
+    É reconstruído uma vez por tick. Durante o tick as criaturas ainda andam
+    até `max_speed` em x, então as consultas usam essa folga para não perder
+    nenhum candidato.
+    """
+    def __init__(self, max_speed=2):
+        self.max_speed = max_speed
+        self._xs = []
+        self._entries = []
+
+    def rebuild(self, creatures):
+        """Reordena as criaturas vivas pela posição x"""
+        entries = sorted(
+            ((c.pos.x, i, c) for i, c in enumerate(creatures) if c.alive),
+            key=lambda e: e[0]
+        )
+        self._xs = [e[0] for e in entries]
+        self._entries = entries
+
+    def query(self, creature, radius):
+        """Criaturas cujo x pode estar a menos de `radius` da criatura, na ordem original"""
+        reach = radius + 2 * self.max_speed
+        lo = bisect_left(self._xs, creature.pos.x - reach)
+        hi = bisect_right(self._xs, creature.pos.x + reach)
+        if hi - lo == 1:
+            return [self._entries[lo][2]]
+        # Mantém a ordem da lista original para preservar o desempate do empilhamento
+        return [e[2] for e in sorted(self._entries[lo:hi], key=lambda e: e[1])]
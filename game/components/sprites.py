@@ -0,0 +1,129 @@
+import pygame
+from collections import OrderedDict
+
+from components.assets import CROWN_IMAGE, load_image
+
+# Quantização dos genes: filhos quase idênticos compartilham o mesmo sprite
+LENGTH_QUANTUM = 1  # pixels
+COLOR_QUANTUM = 8
+
+HEAD_SIZE = 8
+PADDING = 2
+
+
+def sprite_key(dna):
+    """Genes que definem a aparência, quantizados"""
+    r, g, b = dna['color']
+    return (
+        round(dna['leg_length'] / LENGTH_QUANTUM),
+        round(dna['body_size'] / LENGTH_QUANTUM),
+        round(dna['neck_length'] / LENGTH_QUANTUM),
+        r // COLOR_QUANTUM, g // COLOR_QUANTUM, b // COLOR_QUANTUM,
+    )
+
+
+def render_creature(key):
+    """Desenha o corpo da criatura numa superfície transparente.
+
+    Retorna a superfície e a posição dos pés (a `pos` da criatura) dentro dela.
+    """
+    leg_length, body_size, neck_length = (v * LENGTH_QUANTUM for v in key[:3])
+    color = tuple(c * COLOR_QUANTUM + COLOR_QUANTUM // 2 for c in key[3:])
+    total_height = leg_length + body_size + neck_length
+
+    leg_spacing = body_size * 0.6
+    width = int(max(body_size, leg_spacing + 4, HEAD_SIZE * 2)) + 2 * PADDING
+    height = int(total_height + HEAD_SIZE) + 2 * PADDING
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+    # Origem: os pés da criatura
+    x = width // 2
+    y = height - PADDING
+
+    # Pernas (duas linhas)
+    leg_width = 4
+    left_leg_x = x - leg_spacing / 2
+    right_leg_x = x + leg_spacing / 2
+    leg_top_y = y - leg_length
+    pygame.draw.line(surface, color, (left_leg_x, y), (left_leg_x, leg_top_y), leg_width)
+    pygame.draw.line(surface, color, (right_leg_x, y), (right_leg_x, leg_top_y), leg_width)
+
+    # Corpo (círculo)
+    body_y = y - leg_length - body_size / 2
+    pygame.draw.circle(surface, color, (x, int(body_y)), int(body_size / 2))
+
+    # Pescoço (linha)
+    neck_bottom_y = body_y - body_size / 2
+    neck_top_y = neck_bottom_y - neck_length
+    pygame.draw.line(surface, color, (x, neck_bottom_y), (x, neck_top_y), 4)
+
+    # Cabeça (círculo menor)
+    head_y = int(y - total_height)
+    pygame.draw.circle(surface, color, (x, head_y), HEAD_SIZE)
+
+    # Olhos
+    pygame.draw.circle(surface, (0, 0, 0), (x - 3, head_y - 1), 2)
+    pygame.draw.circle(surface, (0, 0, 0), (x + 3, head_y - 1), 2)
+
+    return surface, (x, y)
+
+
+class SpriteCache:
+    """Cache LRU dos sprites das criaturas, chave = genes quantizados"""
+    def __init__(self, max_items=4096):
+        self.max_items = max_items
+        self._sprites = OrderedDict()
+
+    def get(self, dna):
+        key = sprite_key(dna)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = render_creature(key)
+        self._sprites[key] = sprite
+        while len(self._sprites) > self.max_items:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+sprites = SpriteCache()
+
+
+def draw_creatures(screen, creatures, alpha=1.0):
+    """Desenha todas as criaturas vivas com um único `Surface.blits`, retorna os retângulos.
+
+    `alpha` interpola as posições entre o tick anterior (0) e o atual (1).
+    """
+    batch = []
+    best = None
+    for creature in creatures:
+        if not creature.alive:
+            continue
+        surface, (ox, oy) = creature.sprite
+        if alpha == 1.0:
+            x, y = creature.pos
+        else:
+            x, y = creature.draw_pos(alpha)
+        batch.append((surface, (int(x) - ox, int(y) - oy)))
+        if creature.is_best:
+            best = creature
+    rects = screen.blits(batch)
+
+    # Coroa por cima de todas as criaturas
+    if best is not None:
+        rects.append(draw_crown(screen, best, alpha))
+    return rects
+
+
+def draw_crown(screen, creature, alpha=1.0):
+    """Desenha a coroa acima da cabeça da melhor criatura"""
+    crown_image = load_image(CROWN_IMAGE, (30, 30))
+    pos = creature.draw_pos(alpha)
+    crown_x = int(pos.x - 15)  # Centraliza a coroa
+    crown_y = int(pos.y - creature.total_height - 40)  # Posiciona acima da cabeça
+    return screen.blit(crown_image, (crown_x, crown_y))
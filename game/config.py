@@ -0,0 +1,58 @@
+# Configurações compartilhadas entre o jogo e o modo headless
+
+# Tamanho da tela
+SCREEN_WIDTH, SCREEN_HEIGHT = 1020, 680
+
+# Configurações do jogo
+GROUND_Y = SCREEN_HEIGHT - 100
+GENERATION_TIME = 15  # segundos por geração
+FPS = 60
+POPULATION_SIZE = 100
+
+# Spawn da maçã (mantém margens para não sair da tela)
+APPLE_Y = 50
+APPLE_MARGIN = 50
+
+# Seed da execução (None = sorteada e impressa no início)
+SEED = None
+
+# Arquivo onde o jogo salva o log de replay ao sair (None = não salva)
+REPLAY_LOG = None
+
+# Checkpoint do algoritmo genético: retomado ao iniciar se o arquivo existir
+# (None = desativado) e salvo a cada CHECKPOINT_EVERY gerações e ao sair
+CHECKPOINT_PATH = None
+CHECKPOINT_EVERY = 10
+
+# Profiler das fases do loop (F3 liga/desliga durante o jogo) e arquivo
+# .csv/.json para exportar os percentis de cada geração ao sair
+PROFILE = False
+PROFILE_EXPORT = None
+
+# Métricas: '-' (stdout), caminho de arquivo (JSON lines) ou (host, porta);
+# registros por frame são opcionais e limitados a 10 por segundo
+METRICS_TARGET = '-'
+METRICS_PER_FRAME = False
+
+# Cache de fitness do modo headless com o motor vetorizado (0 = desativado).
+# Opcional: a maçã muda a cada geração, então ele quase nunca acerta
+FITNESS_CACHE_SIZE = 0
+
+# Fim antecipado da geração: acaba quando todas as criaturas vivas estão paradas
+# (no chão ou sobre uma criatura parada), já pularam e com o score estável por
+# EARLY_STOP_PATIENCE ticks. Desligado por padrão: muda o fitness de quem
+# ainda se moveria até o fim do orçamento
+EARLY_STOP = False
+EARLY_STOP_PATIENCE = 60
+EARLY_STOP_EPSILON = 1e-3
+
+# Histórico de fitness: só as últimas HISTORY_SIZE gerações ficam em memória;
+# HISTORY_LOG grava as estatísticas de todas num CSV e HISTORY_GENOMES (opcional)
+# grava os genomas e scores de cada geração num log binário
+HISTORY_SIZE = 1000
+HISTORY_LOG = None
+HISTORY_GENOMES = None
+
+# Endpoint HTTP de controle em localhost, ex.: ('127.0.0.1', 8765) (None = desligado):
+# GET /stats, POST /speed?value=8 (ou max), POST /population?size=200
+CONTROL_ADDRESS = None
@@ -0,0 +1,131 @@
+"""Endpoint de controle do jogo: HTTP em localhost, atendido numa thread.
+
+GET /stats devolve as últimas estatísticas publicadas pelo loop. POST
+/speed?value=8 (ou `max`) e POST /population?size=200 viram comandos numa
+fila que o loop lê a cada frame com `commands()`, sem nunca bloquear.
+Só são aceitas as velocidades das teclas 1-4 e populações até um limite,
+para um comando nunca travar a janela nem estourar a memória.
+"""
+import json
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Velocidades da simulação (as mesmas das teclas 1-4); None = máxima
+SPEEDS = (1, 2, 8, None)
+
+# Maior população aceita pelo endpoint
+MAX_POPULATION = 10_000
+
+
+def parse_speed(value):
+    """Uma das velocidades de `SPEEDS`: '1', '2', '8' ou 'max' (None)"""
+    if value == 'max':
+        return None
+    allowed = [speed for speed in SPEEDS if speed is not None]
+    try:
+        speed = int(value)
+    except ValueError:
+        speed = None
+    if speed not in allowed:
+        raise ValueError(f"velocidade inválida, use {', '.join(map(str, allowed))} ou max")
+    return speed
+
+
+def parse_population(value, minimum=3, maximum=MAX_POPULATION):
+    size = int(value)
+    if not minimum <= size <= maximum:
+        raise ValueError(f"a população precisa ter de {minimum} a {maximum} criaturas")
+    return size
+
+
+class ControlServer:
+    """Servidor HTTP de controle em `address` (host, porta; porta 0 escolhe uma livre).
+
+    O loop publica as estatísticas com `publish` (só troca uma referência) e
+    aplica os comandos de `commands()`: tuplas ('speed', valor) ou
+    ('population', tamanho), com o tamanho entre `min_population` e
+    `max_population`.
+    """
+    def __init__(self, address=('127.0.0.1', 0), min_population=3,
+                 max_population=MAX_POPULATION):
+        self._stats = {}
+        self._commands = queue.SimpleQueue()
+        self.min_population = min_population
+        self.max_population = max_population
+        self._server = ThreadingHTTPServer(address, self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='control-server', daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def publish(self, stats):
+        """Troca as estatísticas servidas por GET /stats"""
+        self._stats = stats
+
+    def commands(self):
+        """Comandos recebidos desde a última chamada (não bloqueia)"""
+        while True:
+            try:
+                yield self._commands.get_nowait()
+            except queue.Empty:
+                return
+
+    def _handler(self):
+        control = self
+        parsers = {
+            'speed': ('value', parse_speed),
+            'population': ('size', lambda v: parse_population(v, control.min_population,
+                                                         control.max_population)),
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if urlsplit(self.path).path != '/stats':
+                    return self._reply(404, {'error': 'não encontrado'})
+                self._reply(200, control._stats)
+
+            def do_POST(self):
+                url = urlsplit(self.path)
+                command = url.path.strip('/')
+                if command not in parsers:
+                    return self._reply(404, {'error': 'não encontrado'})
+                field, parse = parsers[command]
+                values = parse_qs(url.query).get(field)
+                if not values:
+                    return self._reply(400, {'error': f"parâmetro '{field}' obrigatório"})
+                try:
+                    value = parse(values[0])
+                except ValueError as e:
+                    return self._reply(400, {'error': str(e)})
+                control._commands.put((command, value))
+                self._reply(202, {command: value})
+
+            def _reply(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass  # Não polui o stdout do jogo
+
+        return Handler
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
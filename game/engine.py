@@ -0,0 +1,165 @@
+"""Motor vetorizado da população: estado das criaturas em arrays NumPy contíguos"""
+import numpy as np
+
+from genome import population_matrix
+
+# Colunas do genoma usadas pela física (as primeiras do layout de `genome.GENES`)
+GENES = ('leg_length', 'neck_length', 'body_size', 'jump_strength', 'jump_timing')
+
+
+class PopulationEngine:
+    """Avança toda a população em um único passo vetorizado.
+
+    Reproduz a semântica de `Creature.update` (movimento até a maçã, pulo no
+    tempo do DNA, gravidade, chão, paredes e pontuação), exceto o empilhamento
+    entre criaturas: cada criatura é simulada de forma independente.
+    """
+    GRAVITY = 0.5
+    MAX_FALL_SPEED = 20
+
+    def __init__(self, genes, x, y, vel_x=None):
+        n = len(genes)
+        self.genes = np.ascontiguousarray(genes, dtype=np.float64).reshape(n, len(GENES))
+
+        # Estado (structure-of-arrays)
+        self.pos = np.empty((n, 2), dtype=np.float64)
+        self.pos[:, 0] = x
+        self.pos[:, 1] = y
+        self.vel = np.zeros((n, 2), dtype=np.float64)
+        if vel_x is not None:
+            self.vel[:, 0] = vel_x
+        self.alive = np.ones(n, dtype=bool)
+        self.on_ground = np.zeros(n, dtype=bool)
+        self.can_jump = np.ones(n, dtype=bool)
+        self.has_jumped = np.zeros(n, dtype=bool)
+        self.jump_timer = np.zeros(n, dtype=np.float64)
+        self.score = np.zeros(n, dtype=np.float64)
+
+        # Fim antecipado: criaturas congeladas não são mais simuladas
+        self.frozen = np.zeros(n, dtype=bool)
+        self.still_ticks = np.zeros(n, dtype=np.int64)
+        self.last_score = np.full(n, np.nan)
+        self.last_x = np.full(n, np.nan)
+
+        # Grandezas derivadas do DNA, calculadas uma vez só
+        leg, neck, body, strength, _ = self.genes.T
+        self.total_height = leg + body + neck
+        self.mass = self.total_height / 15
+        self.jump_force = strength / np.sqrt(self.mass)
+        self.jump_timing = self.genes[:, 4].copy()
+
+    @classmethod
+    def from_creatures(cls, creatures):
+        """Cria o motor a partir de uma lista de `Creature`"""
+        genes = population_matrix(creatures)[:, :len(GENES)]
+        engine = cls(genes,
+                     [c.pos.x for c in creatures],
+                     [c.pos.y for c in creatures],
+                     [c.vel.x for c in creatures])
+        engine.vel[:, 1] = [c.vel.y for c in creatures]
+        engine.alive[:] = [c.alive for c in creatures]
+        engine.on_ground[:] = [c.on_ground for c in creatures]
+        engine.can_jump[:] = [c.can_jump for c in creatures]
+        engine.has_jumped[:] = [c.has_jumped for c in creatures]
+        engine.jump_timer[:] = [c.jump_timer for c in creatures]
+        engine.score[:] = [c.score for c in creatures]
+        engine.frozen[:] = [c.frozen for c in creatures]
+        return engine
+
+    def write_back(self, creatures):
+        """Copia o estado do motor de volta para as criaturas"""
+        for i, c in enumerate(creatures):
+            c.pos.x, c.pos.y = self.pos[i]
+            c.vel.x, c.vel.y = self.vel[i]
+            c.alive = bool(self.alive[i])
+            c.on_ground = bool(self.on_ground[i])
+            c.can_jump = bool(self.can_jump[i])
+            c.has_jumped = bool(self.has_jumped[i])
+            c.jump_timer = float(self.jump_timer[i])
+            c.score = float(self.score[i])
+            c.frozen = bool(self.frozen[i])
+
+    @property
+    def head_pos(self):
+        """Posição da cabeça de cada criatura"""
+        head = self.pos.copy()
+        head[:, 1] -= self.total_height
+        return head
+
+    def step(self, target_pos, width, height, ground_y, delta_time):
+        """Um tick de física para todas as criaturas vivas (e não congeladas).
+
+        `target_pos` é a posição da maçã (x, y) ou um array (N, 2) com a maçã
+        de cada criatura.
+        """
+        active = self.alive & ~self.frozen
+        if not active.any():
+            return
+
+        x = self.pos[:, 0]
+        y = self.pos[:, 1]
+        vx = self.vel[:, 0]
+        vy = self.vel[:, 1]
+        # Uma maçã para todas ou uma por criatura (array N x 2)
+        tx, ty = np.asarray(target_pos, dtype=np.float64).T
+
+        # Direção para a maçã (movimento direcionado)
+        dx = tx - x
+        dy = ty - y
+        length = np.sqrt(dx * dx + dy * dy)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dir_x = np.where(length > 0, dx / length, 0.0)
+        vx[active] = dir_x[active] * 2
+
+        # Timer e pulo no tempo definido pelo DNA
+        self.jump_timer[active] += delta_time
+        jumping = (active & ~self.has_jumped & (self.jump_timer >= self.jump_timing)
+                   & self.can_jump & self.on_ground)
+        vy[jumping] = -self.jump_force[jumping]
+        self.on_ground[jumping] = False
+        self.can_jump[jumping] = False
+        self.has_jumped[jumping] = True
+
+        # Gravidade
+        falling = active & ~self.on_ground
+        vy[falling] = np.minimum(vy[falling] + self.GRAVITY, self.MAX_FALL_SPEED)
+
+        # Atualiza posição
+        self.pos[active] += self.vel[active]
+
+        # Colisão com o chão
+        grounded = active & (y >= ground_y)
+        y[grounded] = ground_y
+        vy[grounded] = 0
+        self.can_jump[grounded] = True
+        self.on_ground[active] = grounded[active]
+
+        # Paredes e queda abaixo do chão
+        self.alive[active & ((x < 0) | (x > width) | (y > ground_y + 100))] = False
+
+        # Pontuação (distância da cabeça até a maçã)
+        head_dx = tx - x
+        head_dy = ty - (y - self.total_height)
+        dist = np.sqrt(head_dx * head_dx + head_dy * head_dy)
+        score = np.maximum(0, 200 / (dist + 1))
+        score += np.where(dist < 50, 50, 0)
+        score += np.where(dist < 20, 100, 0)
+        score -= np.where(dist > 300, 10, 0)
+
+        # Bônus para quem está com a cabeça abaixo da maçã (incentiva pular)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            dir_y = np.where(dist > 0, head_dy / dist, 0.0)
+        score += np.where(dir_y < -0.5, 10, 0)
+
+        self.score[active] = np.maximum(0, score[active])
+
+    def settle(self, patience, epsilon, move_epsilon):
+        """Congela quem ficou parado no chão com score estável por `patience` ticks"""
+        x = self.pos[:, 0]
+        still = (self.alive & ~self.frozen & self.on_ground & self.has_jumped
+                 & (np.abs(self.score - self.last_score) <= epsilon)
+                 & (np.abs(x - self.last_x) <= move_epsilon))
+        self.still_ticks = np.where(still, self.still_ticks + 1, 0)
+        self.last_score[:] = self.score
+        self.last_x[:] = x
+        self.frozen |= self.alive & (self.still_ticks >= patience)
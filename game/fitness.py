@@ -0,0 +1,109 @@
+"""Cache de fitness: evita simular de novo genomas repetidos no mesmo ambiente"""
+from collections import OrderedDict
+
+import numpy as np
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, GENERATION_TIME, FPS
+from engine import GENES, PopulationEngine
+from genome import population_matrix
+from scheduler import EvaluationScheduler
+
+
+class FitnessCache:
+    """Cache LRU de (score, vivo, ticks) por genoma e ambiente.
+
+    A chave junta os genes da física quantizados em `quantum` (a cor não
+    influencia o fitness), a posição de spawn e o ambiente (maçã, dt, duração
+    da geração). Só vale para avaliações determinísticas e independentes, como
+    o motor vetorizado, onde o resultado de uma criatura não depende das outras.
+    """
+    def __init__(self, max_items=100_000, quantum=1e-9):
+        self.max_items = max_items
+        self.quantum = quantum
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def keys(self, genes, spawns, environment):
+        """Chave de cada linha de `genes` (N x len(GENES)) com seu spawn (N x 2)"""
+        genes = np.round(np.asarray(genes) / self.quantum).astype(np.int64)
+        return [(row.tobytes(), x, y, environment)
+                for row, (x, y) in zip(genes, spawns)]
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def simulate_generation_cached(creatures, target_pos, cache, dt=1 / FPS,
+                               generation_time=GENERATION_TIME, width=SCREEN_WIDTH,
+                               height=SCREEN_HEIGHT, ground_y=GROUND_Y, scheduler=None):
+    """`simulate_generation_vectorized` que só simula os genomas fora do cache.
+
+    Espera criaturas recém-criadas (como as que saem de `spawn`). Define
+    `score` e `alive` de todas e retorna o número de ticks que a geração
+    inteira teria durado.
+    """
+    scheduler = scheduler or EvaluationScheduler(generation_time, early_stop=False)
+    early_stop = scheduler.settings()
+    environment = (tuple(target_pos), dt, scheduler.budget,
+                   tuple(early_stop.values()) if early_stop else None, width, height, ground_y)
+    genes = population_matrix(creatures)[:, :len(GENES)]
+    keys = cache.keys(genes, [(c.pos.x, c.pos.y) for c in creatures], environment)
+    entries = [cache.get(key) for key in keys]
+    misses = [i for i, entry in enumerate(entries) if entry is None]
+
+    if misses:
+        simulated = [creatures[i] for i in misses]
+        engine = PopulationEngine.from_creatures(simulated)
+        # Tick em que cada criatura morreu ou congelou (a geração dura até a última)
+        finish_tick = np.zeros(len(simulated), dtype=np.int64)
+        scheduler.start()
+        ticks = 0
+        while not scheduler.expired:
+            scheduler.tick(dt)
+            if not engine.alive.any():
+                break
+            was_active = engine.alive & ~engine.frozen
+            engine.step(target_pos, width, height, ground_y, dt)
+            ticks += 1
+            remaining = scheduler.settle_engine(engine)
+            finish_tick[was_active & ~(engine.alive & ~engine.frozen)] = ticks
+            if remaining == 0:
+                break
+        finish_tick[engine.alive & ~engine.frozen] = ticks
+
+        engine.write_back(simulated)
+        for j, i in enumerate(misses):
+            entries[i] = (float(engine.score[j]), bool(engine.alive[j]), int(finish_tick[j]))
+            cache.put(keys[i], entries[i])
+
+    max_ticks = 0
+    for creature, (score, alive, ticks) in zip(creatures, entries):
+        creature.score = score
+        creature.alive = alive
+        max_ticks = max(max_ticks, ticks)
+    return max_ticks
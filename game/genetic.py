@@ -1,118 +1,79 @@
-import random
-from components.creature import Creature
+import numpy as np
+import checkpoint
+import genome
+from genome import Genome, N_GENES, population_matrix
+from history import FitnessHistory
+from pool import CreaturePool
+from seeds import SPAWN_STREAM, make_seed, spawn_rng
+from stats import PopulationStats
 
 class GeneticAlgorithm:
-    def __init__(self, population_size=20):
+    def __init__(self, population_size=20, seed=None, track_stats=False):
         self.population_size = population_size
         self.generation = 1
-        self.best_fitness_history = []
+        # Seed da execução; cada geração tem seu próprio RNG derivado dela
+        self.seed = make_seed(seed)
+        self.rng = spawn_rng(self.seed, self.generation)
+        # Buffer circular com o melhor fitness das últimas gerações (e o máximo geral)
+        self.best_fitness_history = FitnessHistory()
+        # Matriz (population_size x N_GENES) com os genomas da geração atual e a
+        # da próxima: `evolve` escreve numa e troca, sem alocar a cada geração
+        self.genomes = np.empty((population_size, N_GENES))
+        self._next_genomes = None
+        # Criaturas reaproveitadas entre gerações (ver `CreaturePool`)
+        self.pool = CreaturePool()
         # Mutação adaptiva, diminui com o tempo
         self.mutation_rate = max(0.01, 0.1 - (self.generation * 0.001)) 
+        # Distribuição do passo da mutação: 'uniform' ou 'gaussian'
+        self.mutation = 'uniform'
+        # Elitismo: quantos melhores passam direto para a próxima geração
+        self.elite_count = 2
+        # Avaliador opcional com `scores(população, geração)` (ex.: ScenarioEvaluator);
+        # sem ele o fitness é o `score` deixado pela simulação
+        self.evaluator = None
+        # Estatísticas da população atual. Com `track_stats` (loop com janela) as
+        # criaturas atualizam o tracker a cada tick; sem ele (headless, workers)
+        # as estatísticas são recalculadas só quando lidas
+        self.track_stats = track_stats
+        self.stats = PopulationStats()
         
     def create_population(self, x, y):
         """Cria população inicial com DNA aleatório"""
-        population = []
         for i in range(self.population_size):
-            # Espalha as criaturas horizontalmente
-            spawn_x = x + (i - self.population_size // 2) * 30
-            population.append(Creature(spawn_x, y))
-        return population
+            Genome.random(self.genomes[i], self.rng)
+        # Espalha as criaturas horizontalmente
+        return self.spawn(x, y)
     
     def evaluate_fitness(self, population):
         """Calcula e normaliza fitness de toda população"""
-        total_fitness = sum(c.score for c in population)
+        if self.evaluator is not None:
+            # Avaliador plugado (ex.: vários cenários por genoma)
+            scores = np.asarray(self.evaluator.scores(population, self.generation))
+        else:
+            scores = np.fromiter((c.score for c in population), dtype=np.float64,
+                                 count=len(population))
+        total_fitness = scores.sum()
         if total_fitness == 0:
-            return [1.0 / len(population)] * len(population)
+            return np.full(len(population), 1.0 / len(population))
         
         # Normaliza fitness entre 0 e 1
-        return [c.score / total_fitness for c in population]
+        return scores / total_fitness
     
-    def selection(self, population, fitness_scores):
-        """Seleção por torneio - escolhe os melhores indivíduos"""
-        tournament_size = 3
-        selected = []
-        
-        for _ in range(self.population_size):
-            # Escolhe 3 indivíduos aleatórios
-            tournament_indices = random.sample(range(len(population)), tournament_size)
-            tournament = [(population[i], fitness_scores[i]) for i in tournament_indices]
-            
-            # Seleciona o melhor do torneio
-            winner = max(tournament, key=lambda x: x[1])[0]
-            selected.append(winner)
-        
-        return selected
+    def selection(self, genomes, fitness_scores):
+        """Seleção por torneio - escolhe os melhores indivíduos (matriz de genomas dos pais)"""
+        # Todos os torneios de 3 sorteados de uma vez
+        winners = genome.tournament(fitness_scores, self.population_size, 3, self.rng)
+        return genomes[winners]
     
-    def crossover(self, parent1, parent2):
-        """Combina DNA de dois pais para criar filho"""
-        child_dna = {}
-        
+    def crossover(self, parents1, parents2):
+        """Combina os genomas de dois pais (matrizes N x N_GENES) para criar os filhos"""
         # Para cada gene, escolhe aleatoriamente de um dos pais ou faz média
-        for gene, value in parent1.dna.items():
-            if random.random() < 0.5:
-                # Pega do pai 1
-                child_dna[gene] = parent1.dna[gene]
-            else:
-                # Pega do pai 2
-                child_dna[gene] = parent2.dna[gene]
-            
-            # Às vezes faz média dos dois pais
-            if random.random() < 0.3 and gene != 'color':
-                if isinstance(parent1.dna[gene], (int, float)):
-                    child_dna[gene] = (parent1.dna[gene] + parent2.dna[gene]) / 2
-        
-        return child_dna
+        return genome.crossover(parents1, parents2, self.rng)
     
-    def mutate(self, dna):
-        """Aplica mutações aleatórias no DNA"""
-        mutated_dna = dna.copy()
-        
-        # Mutação no comprimento das pernas
-        if random.random() < self.mutation_rate:
-            mutated_dna['leg_length'] = max(20, min(60, 
-                mutated_dna['leg_length'] + random.uniform(-10, 10)))
-        
-            # mutated_dna['leg_length'] = max(20, (60 - mutated_dna['body_size'])) #sem controle
-        
-        # Mutação no comprimento do pescoço
-        if random.random() < self.mutation_rate:
-            mutated_dna['neck_length'] = max(15, min(80, 
-                mutated_dna['neck_length'] + random.uniform(-15, 15)))
-
-            # mutated_dna['neck_length'] = max(15, (80 - mutated_dna['leg_length'])) #sem controle
-        
-        # Mutação no tamanho do corpo
-        if random.random() < self.mutation_rate:
-            mutated_dna['body_size'] = max(15, min(35, 
-                mutated_dna['body_size'] + random.uniform(-5, 5)))
-
-            # mutated_dna['body_size'] = max(15, (35 - mutated_dna['leg_length'])) #sem controle
-        
-        # Mutação na força do pulo
-        if random.random() < self.mutation_rate:
-            mutated_dna['jump_strength'] = max(8, min(18, 
-                mutated_dna['jump_strength'] + random.uniform(-3, 3)))
-
-            # mutated_dna['jump_strength'] = max(8, (18 - mutated_dna['body_size'])) #sem controle
-        
-
-        # Mutação no timing do pulo
-        if random.random() < self.mutation_rate:
-            mutated_dna['jump_timing'] = max(0.5, min(3.0, 
-                mutated_dna['jump_timing'] + random.uniform(-0.5, 0.5)))
-
-            # mutated_dna['jump_timing'] = max(0.5, (3.0 - mutated_dna['body_size'])) #sem controle
-
-        # Mutação na cor
-        if random.random() < self.mutation_rate:
-            r, g, b = mutated_dna['color']
-            mutated_dna['color'] = (
-                max(0, min(255, r + random.randint(-30, 30))),
-                max(0, min(255, g + random.randint(-30, 30))),
-                max(0, min(255, b + random.randint(-30, 30)))
-            )
-        
-        return mutated_dna
+    def mutate(self, genomes):
+        """Aplica mutações aleatórias em todos os genomas de uma vez"""
+        return genome.mutate(genomes, self.mutation_rate, self.rng,
+                             gaussian=self.mutation == 'gaussian')
     
     def evolve(self, population, spawn_x, spawn_y):
         """Evolui a população para a próxima geração"""
@@ -120,72 +81,109 @@ class GeneticAlgorithm:
         fitness_scores = self.evaluate_fitness(population)
         
         # Guarda o melhor fitness
-        best_score = max(c.score for c in population)
-        self.best_fitness_history.append(best_score)
+        self.best_fitness_history.append(self._stats_for(population).best)
         
-        # Ordena população por fitness
-        sorted_pop = sorted(zip(population, fitness_scores), key=lambda x: x[1], reverse=True)
-        population = [p[0] for p in sorted_pop]
-        fitness_scores = [f[1] for f in sorted_pop]
+        # Ordena população por fitness (estável: empates mantêm a ordem)
+        order = np.argsort(-fitness_scores, kind='stable')
+        fitness_scores = fitness_scores[order]
+        sorted_genomes = population_matrix(population)[order]
         
-        # Nova população
-        new_population = []
+        # Nova matriz de genomas (no buffer da próxima geração)
+        genomes = self._genome_buffer()
         
         # Elitismo: mantém os 2 melhores
-        elite_count = 2
-        for i in range(elite_count):
-            new_creature = Creature(spawn_x + (i - elite_count // 2) * 30, spawn_y, 
-                                   population[i].dna.copy())
-            new_population.append(new_creature)
-        
-        # Seleciona pais e cria filhos
-        parents = self.selection(population, fitness_scores)
+        elite_count = self.elite_count
+        genomes[:elite_count] = sorted_genomes[:elite_count]
         
-        for i in range(elite_count, self.population_size):
-            # Escolhe dois pais aleatórios
-            parent1 = random.choice(parents)
-            parent2 = random.choice(parents)
-            
-            # Crossover
-            child_dna = self.crossover(parent1, parent2)
-            
-            # Mutação
-            child_dna = self.mutate(child_dna)
-            
-            # Cria nova criatura
-            spawn_offset = (i - self.population_size // 2) * 30
-            new_creature = Creature(spawn_x + spawn_offset, spawn_y, child_dna)
-            new_population.append(new_creature)
+        # Seleciona pais e cria filhos (seleção, crossover e mutação em lote)
+        parents = self.selection(sorted_genomes, fitness_scores)
+        children = self.population_size - elite_count
+        parents1 = parents[self.rng.integers(len(parents), size=children)]
+        parents2 = parents[self.rng.integers(len(parents), size=children)]
+        genomes[elite_count:] = self.mutate(self.crossover(parents1, parents2))
         
+        self.genomes, self._next_genomes = genomes, self.genomes
         self.generation += 1
-        return new_population
+        self.rng = spawn_rng(self.seed, self.generation)
+        return self.spawn(spawn_x, spawn_y)
     
+    def spawn(self, x, y):
+        """Cria as criaturas da matriz de genomas, espalhadas horizontalmente"""
+        # A partir da 2ª geração as primeiras linhas são a elite
+        elite_count = self.elite_count if self.generation > 1 else 0
+        # Stream próprio: recriar a população (ex.: ao retomar um checkpoint) não
+        # consome o RNG da geração
+        rng = spawn_rng(self.seed, self.generation, SPAWN_STREAM)
+        spawns = []
+        for i in range(self.population_size):
+            if i < elite_count:
+                spawn_offset = (i - elite_count // 2) * 30
+            else:
+                spawn_offset = (i - self.population_size // 2) * 30
+            spawns.append((x + spawn_offset, y))
+        population = self.pool.population(spawns, self.genomes, rng)
+        if self.track_stats:
+            self.stats.reset(population)
+        return population
+
+    def _genome_buffer(self):
+        """Buffer da próxima geração (realocado só se o tamanho da população mudou)"""
+        shape = (self.population_size, N_GENES)
+        buffer = self._next_genomes
+        if (buffer is None or buffer.shape != shape or buffer is self.genomes
+                or not buffer.flags.writeable):
+            buffer = np.empty(shape)
+        return buffer
+    
+    def save_checkpoint(self, path):
+        """Salva genomas, geração, histórico de fitness e estado do RNG"""
+        checkpoint.save(path, *self.checkpoint_state())
+
+    def checkpoint_state(self):
+        """Cópia do estado salvo no checkpoint: (genomas, geração, histórico, meta).
+
+        Não compartilha nada com o algoritmo, então pode ser gravada em outra
+        thread enquanto a evolução continua.
+        """
+        history = self.best_fitness_history
+        return np.array(self.genomes), self.generation, history.values(), {
+            'seed': self.seed,
+            'rng': self.rng.bit_generator.state,
+            'mutation_rate': self.mutation_rate,
+            'elite_count': self.elite_count,
+            'mutation': self.mutation,
+            'history_total': history.total,
+            'history_max': history.max,
+        }
+    
+    @classmethod
+    def load_checkpoint(cls, path, mmap=False, track_stats=False):
+        """Restaura o algoritmo de um checkpoint (`mmap` mapeia os genomas sem copiar)"""
+        genomes, generation, history, meta = checkpoint.load(path, mmap)
+        ga = cls(population_size=len(genomes), seed=meta['seed'], track_stats=track_stats)
+        ga.generation = generation
+        ga.genomes = genomes
+        ga.best_fitness_history = FitnessHistory(values=history,
+                                                 total=meta.get('history_total'),
+                                                 best=meta.get('history_max'))
+        ga.mutation_rate = meta['mutation_rate']
+        ga.elite_count = meta['elite_count']
+        ga.mutation = meta.get('mutation', 'uniform')
+        ga.rng.bit_generator.state = meta['rng']
+        return ga
+    
+    def _stats_for(self, population):
+        """Estatísticas da população (recalculadas na leitura se não há tracker ligado)"""
+        if not self.track_stats:
+            self.stats.reset(population, attach=False)
+        elif self.stats.population is not population:
+            self.stats.reset(population)
+        return self.stats
+
     def get_best_creature(self, population):
         """Retorna a melhor criatura da população"""
-        return max(population, key=lambda c: c.score)
+        return self._stats_for(population).best_creature
     
     def get_statistics(self, population):
         """Retorna estatísticas da população atual"""
-        scores = [c.score for c in population]
-
-        # Garante que as pontuações sejam tratadas corretamente
-        if not scores:
-            return {
-                'best': 0,
-                'worst': 0,
-                'average': 0,
-                'median': 0
-            }
-
-        best = max(scores)
-        worst = min(scores)
-        average = sum(scores)
-        median = sum(scores) / len(scores)
-
-        # Normaliza os valores para evitar médias negativas ou inconsistências
-        return {
-            'best': round(best, 2),
-            'worst': round(worst, 2),
-            'average': round(average, 2),
-            'median': round(median, 2)
-        }
+        return self._stats_for(population).summary()
@@ -0,0 +1,143 @@
+"""Genoma compacto: uma linha float64 de layout fixo numa matriz da população"""
+from collections.abc import Mapping
+
+import numpy as np
+
+from seeds import DEFAULT_RNG
+
+# Layout fixo das colunas do genoma
+GENES = ('leg_length', 'neck_length', 'body_size', 'jump_strength', 'jump_timing',
+         'color_r', 'color_g', 'color_b')
+N_GENES = len(GENES)
+INDEX = {gene: i for i, gene in enumerate(GENES)}
+COLOR = slice(5, 8)
+
+# Chaves do antigo dicionário de DNA (a cor é um gene só, com 3 canais)
+DNA_KEYS = ('leg_length', 'neck_length', 'body_size', 'jump_strength', 'color', 'jump_timing')
+
+# Grupos de colunas que são herdados/mutados juntos (um por chave do DNA)
+GROUPS = np.array([0, 1, 2, 3, 4, 5, 5, 5])
+N_GROUPS = 6
+COLOR_GROUP = 5
+
+# Limites e passo máximo da mutação, por coluna
+LOWER = np.array([20, 15, 15, 8, 0.5, 0, 0, 0], dtype=np.float64)
+UPPER = np.array([60, 80, 35, 18, 3.0, 255, 255, 255], dtype=np.float64)
+MUTATION_STEP = np.array([10, 15, 5, 3, 0.5, 30, 30, 30], dtype=np.float64)
+
+
+class Genome(Mapping):
+    """Visão de uma linha da matriz de genomas com a interface do antigo dicionário"""
+    __slots__ = ('data',)
+
+    def __init__(self, data=None):
+        self.data = np.zeros(N_GENES) if data is None else data
+
+    @classmethod
+    def random(cls, out=None, rng=None):
+        """Genoma aleatório (mesmas faixas do DNA inicial das criaturas)"""
+        rng = rng or DEFAULT_RNG
+        genome = cls(out)
+        genome.data[0] = rng.uniform(10, 30)
+        genome.data[1] = rng.uniform(7.5, 40)
+        genome.data[2] = rng.uniform(7.5, 17.5)
+        genome.data[3] = rng.uniform(2, 15)
+        genome.data[COLOR] = rng.integers(100, 255, 3, endpoint=True)
+        genome.data[4] = rng.uniform(1, 3.0)  # Quando pular em segundos
+        return genome
+
+    @classmethod
+    def from_dict(cls, dna, out=None):
+        """Converte um DNA no formato de dicionário"""
+        genome = cls(out)
+        for gene in DNA_KEYS:
+            genome[gene] = dna[gene]
+        return genome
+
+    def __getitem__(self, gene):
+        if gene == 'color':
+            r, g, b = self.data[COLOR]
+            return (int(r), int(g), int(b))
+        return float(self.data[INDEX[gene]])
+
+    def __setitem__(self, gene, value):
+        if gene == 'color':
+            self.data[COLOR] = value
+        else:
+            self.data[INDEX[gene]] = value
+
+    def __iter__(self):
+        return iter(DNA_KEYS)
+
+    def __len__(self):
+        return len(DNA_KEYS)
+
+    def copy(self):
+        return Genome(self.data.copy())
+
+    def __repr__(self):
+        return f"Genome({dict(self)})"
+
+
+def population_matrix(population):
+    """Matriz (N, N_GENES) com os genomas da população"""
+    if not population:
+        return np.empty((0, N_GENES))
+    return np.stack([c.dna.data for c in population])
+
+
+def tournament(fitness, n, size=3, rng=DEFAULT_RNG):
+    """Seleção por torneio em lote: índices dos vencedores de `n` torneios de `size`.
+
+    Os participantes de cada torneio são distintos (sorteio sem reposição
+    feito coluna a coluna, pulando os índices já sorteados na linha).
+    """
+    fitness = np.asarray(fitness)
+    pool = len(fitness)
+    size = min(size, pool)
+    picks = np.empty((n, size), dtype=np.int64)
+    for k in range(size):
+        index = rng.integers(pool - k, size=n)
+        # Desloca o índice para pular os já sorteados (em ordem crescente)
+        for taken in np.sort(picks[:, :k], axis=1).T:
+            index += index >= taken
+        picks[:, k] = index
+
+    # Vencedor: maior fitness (empate fica com o primeiro sorteado)
+    winners = np.argmax(fitness[picks], axis=1)
+    return picks[np.arange(n), winners]
+
+
+def crossover(parents1, parents2, rng=DEFAULT_RNG):
+    """Crossover uniforme em lote: cada grupo de genes vem de um dos pais, às vezes a média"""
+    n = len(parents1)
+    from_first = (rng.random((n, N_GROUPS)) < 0.5)[:, GROUPS]
+    children = np.where(from_first, parents1, parents2)
+
+    # Às vezes faz média dos dois pais (nunca na cor)
+    average = rng.random((n, N_GROUPS)) < 0.3
+    average[:, COLOR_GROUP] = False
+    average = average[:, GROUPS]
+    children[average] = (parents1[average] + parents2[average]) / 2
+    return children
+
+
+def mutate(genomes, mutation_rate, rng=DEFAULT_RNG, gaussian=False):
+    """Mutação em lote: soma um passo aleatório e limita aos bounds só nos genes sorteados.
+
+    O passo é uniforme em ±`MUTATION_STEP` ou, com `gaussian`, normal com
+    desvio `MUTATION_STEP / 2`.
+    """
+    n = len(genomes)
+    mask = (rng.random((n, N_GROUPS)) < mutation_rate)[:, GROUPS]
+
+    if gaussian:
+        step = rng.normal(0, 0.5, (n, N_GENES)) * MUTATION_STEP
+        step[:, COLOR] = np.rint(step[:, COLOR])
+    else:
+        step = rng.uniform(-1, 1, (n, N_GENES)) * MUTATION_STEP
+        # Canais de cor mudam em passos inteiros
+        step[:, COLOR] = rng.integers(-30, 30, (n, 3), endpoint=True)
+
+    mutated = np.clip(genomes + step, LOWER, UPPER)
+    return np.where(mask, mutated, genomes)
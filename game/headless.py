@@ -0,0 +1,204 @@
+"""Modo headless: evolui criaturas sem janela, sem assets e sem relógio de frames"""
+import argparse
+
+from config import (SCREEN_WIDTH, GROUND_Y, GENERATION_TIME, FPS, POPULATION_SIZE,
+                    FITNESS_CACHE_SIZE, EARLY_STOP, EARLY_STOP_PATIENCE)
+from fitness import FitnessCache, simulate_generation_cached
+from genetic import GeneticAlgorithm
+from history import HistoryLog
+from parallel import DEFAULT_ISLANDS, ParallelEvaluator
+from profiler import peak_memory_mb
+from replay import RunLog
+from scenarios import AGGREGATES, ScenarioEvaluator
+from scheduler import EvaluationScheduler
+from simulation import SIMULATORS, spawn_apple
+
+
+def _apple_for(ga, generation, apples=None, scenarios=None):
+    """Maçã da geração: a do primeiro cenário, a de `apples` ou a sorteada pela seed"""
+    if scenarios is not None:
+        return tuple(int(v) for v in scenarios.apples(generation)[0])
+    if apples is not None:
+        return tuple(apples[generation - 1])
+    return spawn_apple(ga.seed, generation)
+
+
+def iter_generations(generations, population_size=POPULATION_SIZE, seed=None,
+                     dt=1 / FPS, generation_time=GENERATION_TIME, engine='creature',
+                     workers=None, islands=DEFAULT_ISLANDS, apples=None, resume=None,
+                     checkpoint_path=None, checkpoint_every=None, fitness_cache=None,
+                     scheduler=None, scenarios=None):
+    """Gera (ga, criaturas, estatísticas) de cada geração já avaliada, antes de evoluir.
+
+    `apples` (ex.: de um `RunLog`) substitui o sorteio da maçã de cada geração.
+    `resume` continua de um checkpoint; com `checkpoint_path` o estado é salvo a
+    cada `checkpoint_every` gerações. Um `FitnessCache` em `fitness_cache` evita
+    re-simular genomas repetidos (só com o motor 'vector' e sem workers). Um
+    `EvaluationScheduler` em `scheduler` define o orçamento da geração (no lugar
+    de `generation_time`) e o fim antecipado. Com um `ScenarioEvaluator` em
+    `scenarios`, cada genoma é avaliado contra várias maçãs (ignora `apples`).
+    """
+    simulate = SIMULATORS[engine]
+    if engine != 'vector' or workers is not None:
+        fitness_cache = None
+
+    if resume is not None:
+        ga = GeneticAlgorithm.load_checkpoint(resume)
+        creatures = ga.spawn(SCREEN_WIDTH // 2, GROUND_Y)
+    else:
+        ga = GeneticAlgorithm(population_size=population_size, seed=seed)
+        creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+
+    if scenarios is not None:
+        if scenarios.seed is None:
+            scenarios.seed = ga.seed
+        ga.evaluator = scenarios
+
+    evaluator = None
+    if workers is not None and scenarios is None:
+        evaluator = ParallelEvaluator(workers, islands, ga.seed, dt, generation_time, engine,
+                                      scheduler)
+
+    try:
+        for _ in range(generations):
+            apple_pos = _apple_for(ga, ga.generation, apples, scenarios)
+
+            if scenarios is not None:
+                ticks = scenarios.evaluate(creatures, ga.generation)
+            elif fitness_cache is not None:
+                ticks = simulate_generation_cached(creatures, apple_pos, fitness_cache,
+                                                   dt, generation_time, scheduler=scheduler)
+            elif evaluator is None:
+                ticks = simulate(creatures, apple_pos, dt, generation_time, scheduler=scheduler)
+            else:
+                ticks = evaluator.evaluate(creatures, apple_pos, ga.generation)
+
+            stats = ga.get_statistics(creatures)
+            stats['generation'] = ga.generation
+            stats['alive'] = ga.stats.alive_count
+            stats['ticks'] = ticks
+            stats['apple'] = apple_pos
+            if fitness_cache is not None:
+                stats['cache_hit_rate'] = round(fitness_cache.hit_rate, 3)
+            yield ga, creatures, stats
+
+            creatures = ga.evolve(creatures, SCREEN_WIDTH // 2, GROUND_Y)
+
+            if checkpoint_path and checkpoint_every and (ga.generation - 1) % checkpoint_every == 0:
+                ga.save_checkpoint(checkpoint_path)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+
+
+def run_headless(generations, population_size=POPULATION_SIZE, seed=None,
+                 dt=1 / FPS, generation_time=GENERATION_TIME, engine='creature',
+                 workers=None, islands=DEFAULT_ISLANDS, log=None, resume=None,
+                 checkpoint_path=None, checkpoint_every=None, fitness_cache=None,
+                 scheduler=None, history_log=None, scenarios=None):
+    """Evolui `generations` gerações o mais rápido possível e retorna as estatísticas.
+
+    Com `workers` a avaliação é dividida em `islands` ilhas num pool de processos.
+    Se `log` (um `RunLog`) for passado, ele é preenchido para permitir o replay;
+    um `HistoryLog` em `history_log` recebe as estatísticas de cada geração.
+    """
+    history = []
+    for ga, creatures, stats in iter_generations(generations, population_size, seed, dt,
+                                                 generation_time, engine, workers, islands,
+                                                 resume=resume,
+                                                 checkpoint_path=checkpoint_path,
+                                                 checkpoint_every=checkpoint_every,
+                                                 fitness_cache=fitness_cache,
+                                                 scheduler=scheduler,
+                                                 scenarios=scenarios):
+        history.append(stats)
+        if history_log is not None:
+            history_log.record(stats['generation'], stats, creatures)
+        if log is not None:
+            if len(history) == 1:
+                log.seed = ga.seed
+                log.population_size = ga.population_size
+                # Retomando de um checkpoint: o replay começa da geração 1, então
+                # grava também as maçãs das gerações anteriores
+                for generation in range(1, ga.generation):
+                    log.record(_apple_for(ga, generation, scenarios=scenarios))
+            log.record(stats['apple'])
+
+    if log is not None:
+        log.dt = dt
+        log.generation_time = scheduler.budget if scheduler is not None else generation_time
+        log.early_stop = scheduler.settings() if scheduler is not None else None
+        log.scenarios = scenarios.settings() if scenarios is not None else None
+        log.engine = engine
+        log.islands = islands if workers is not None else None
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolução de criaturas sem janela")
+    parser.add_argument('-g', '--generations', type=int, default=10)
+    parser.add_argument('-p', '--population', type=int, default=POPULATION_SIZE)
+    parser.add_argument('-s', '--seed', type=int, default=None)
+    parser.add_argument('-e', '--engine', choices=SIMULATORS, default='creature',
+                        help="'vector' usa o motor NumPy (sem empilhamento); 'analytic' dá o "
+                             "mesmo resultado de 'creature' sem simular tick a tick quem "
+                             "não se empilha")
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help="avalia em paralelo com N processos")
+    parser.add_argument('-i', '--islands', type=int, default=DEFAULT_ISLANDS,
+                        help="ilhas independentes na avaliação paralela")
+    parser.add_argument('--log', help="salva o log de replay (seed + maçãs) neste arquivo")
+    parser.add_argument('--checkpoint', help="arquivo de checkpoint do estado do GA")
+    parser.add_argument('--checkpoint-every', type=int, default=10,
+                        help="salva o checkpoint a cada N gerações")
+    parser.add_argument('--resume', action='store_true',
+                        help="continua a partir do arquivo de --checkpoint")
+    parser.add_argument('--fitness-cache', type=int, default=FITNESS_CACHE_SIZE,
+                        help="tamanho do cache de fitness do motor vector (0 desativa, o padrão)")
+    parser.add_argument('--budget', type=float, default=GENERATION_TIME,
+                        help="segundos simulados por geração")
+    parser.add_argument('--early-stop', action=argparse.BooleanOptionalAction,
+                        default=EARLY_STOP,
+                        help="acaba a geração quando todas as criaturas vivas pararem")
+    parser.add_argument('--patience', type=int, default=EARLY_STOP_PATIENCE,
+                        help="ticks parados até congelar uma criatura")
+    parser.add_argument('--history', help="grava as estatísticas de cada geração neste CSV")
+    parser.add_argument('--history-genomes',
+                        help="grava também os genomas e scores de cada geração (binário)")
+    parser.add_argument('--scenarios', type=int, default=1,
+                        help="avalia cada genoma contra K maçãs (motor vetorizado)")
+    parser.add_argument('--aggregate', choices=AGGREGATES, default='mean',
+                        help="como juntar os scores dos cenários")
+    args = parser.parse_args()
+
+    log = RunLog()
+    history_log = HistoryLog(args.history, args.history_genomes) if args.history else None
+    scheduler = EvaluationScheduler(args.budget, args.patience, early_stop=args.early_stop)
+    scenarios = None
+    if args.scenarios > 1:
+        scenarios = ScenarioEvaluator(args.scenarios, args.aggregate,
+                                      generation_time=args.budget, scheduler=scheduler)
+    fitness_cache = FitnessCache(args.fitness_cache) if args.fitness_cache else None
+    resume = args.checkpoint if args.resume else None
+    for stats in run_headless(args.generations, args.population, args.seed,
+                              engine=args.engine, workers=args.workers,
+                              islands=args.islands, log=log, resume=resume,
+                              checkpoint_path=args.checkpoint,
+                              checkpoint_every=args.checkpoint_every,
+                              fitness_cache=fitness_cache, scheduler=scheduler,
+                              history_log=history_log, scenarios=scenarios):
+        print(f"Geração {stats['generation']}: {stats}")
+
+    if history_log is not None:
+        history_log.close()
+
+    print(f"Seed: {log.seed}")
+    peak = peak_memory_mb()
+    if peak is not None:
+        print(f"Pico de memória: {peak:.1f} MB")
+    if args.log:
+        log.save(args.log)
+
+
+if __name__ == '__main__':
+    main()
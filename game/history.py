@@ -0,0 +1,148 @@
+"""Histórico de gerações: buffer circular em memória e log append-only em disco"""
+import csv
+import os
+import struct
+
+import numpy as np
+
+from config import HISTORY_SIZE
+from genome import population_matrix
+
+# Colunas do log de estatísticas (chaves extras das estatísticas são ignoradas)
+STAT_COLUMNS = ('generation', 'best', 'worst', 'average', 'median', 'alive', 'ticks')
+
+# Cabeçalho de cada bloco do log de genomas: geração, população, genes por genoma
+CHUNK = struct.Struct('<QQH')
+
+
+class FitnessHistory:
+    """Melhor fitness por geração, guardando só as últimas `maxlen` em memória.
+
+    `max` é o maior valor já visto na execução inteira (mantido a cada
+    `append`, sem varrer o buffer) e `total` conta todas as gerações.
+    """
+    def __init__(self, maxlen=HISTORY_SIZE, values=(), total=None, best=None):
+        self.maxlen = maxlen
+        self._buffer = np.zeros(maxlen)
+        self._start = 0
+        self._len = 0
+        self.total = 0
+        self.max = None
+        for value in values:
+            self.append(value)
+        if total is not None:
+            self.total = total
+        if best is not None:
+            self.max = best
+
+    def append(self, value):
+        end = (self._start + self._len) % self.maxlen
+        self._buffer[end] = value
+        if self._len < self.maxlen:
+            self._len += 1
+        else:
+            self._start = (self._start + 1) % self.maxlen
+        self.total += 1
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def values(self):
+        """Valores em memória, do mais antigo ao mais recente"""
+        return np.roll(self._buffer, -self._start)[:self._len]
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return iter(self.values().tolist())
+
+    def __getitem__(self, index):
+        values = self.values()[index]
+        return values.tolist() if isinstance(index, slice) else float(values)
+
+    def __repr__(self):
+        return f"FitnessHistory({self.values().tolist()}, total={self.total}, max={self.max})"
+
+
+class HistoryLog:
+    """Grava as estatísticas de cada geração num CSV append-only.
+
+    Com `genomes_path`, grava também a matriz de genomas e os scores de cada
+    geração num arquivo binário em blocos (`CHUNK` + scores + genomas, float64
+    little-endian). Os arquivos são descarregados no disco a cada
+    `flush_every` gerações e ao fechar.
+    """
+    def __init__(self, path, genomes_path=None, flush_every=10):
+        self.flush_every = flush_every
+        self._pending = 0
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._stats_file = open(path, 'a', newline='')
+        self._writer = csv.DictWriter(self._stats_file, fieldnames=STAT_COLUMNS,
+                                      extrasaction='ignore', restval='')
+        if new_file:
+            self._writer.writeheader()
+
+        self._genomes_file = open(genomes_path, 'ab') if genomes_path else None
+
+    def record(self, generation, stats, population=None):
+        """Adiciona uma geração (os genomas e scores de `population` vão para o log binário)"""
+        genomes = scores = None
+        if self._genomes_file is not None and population is not None:
+            genomes, scores = snapshot(population)
+        self.write(generation, stats, genomes, scores)
+
+    def write(self, generation, stats, genomes=None, scores=None):
+        """Mesmo que `record`, com os genomas e scores já copiados (ver `snapshot`)"""
+        self._writer.writerow({**stats, 'generation': generation})
+
+        if self._genomes_file is not None and genomes is not None:
+            genomes = np.ascontiguousarray(genomes, dtype='<f8')
+            scores = np.ascontiguousarray(scores, dtype='<f8')
+            self._genomes_file.write(CHUNK.pack(generation, *genomes.shape))
+            self._genomes_file.write(scores.tobytes())
+            self._genomes_file.write(genomes.tobytes())
+
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self._stats_file.flush()
+        if self._genomes_file is not None:
+            self._genomes_file.flush()
+        self._pending = 0
+
+    def close(self):
+        self.flush()
+        self._stats_file.close()
+        if self._genomes_file is not None:
+            self._genomes_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def snapshot(population):
+    """Cópia (genomas, scores) da população, para gravar depois com `HistoryLog.write`"""
+    genomes = population_matrix(population)
+    scores = np.fromiter((c.score for c in population), dtype=np.float64, count=len(population))
+    return genomes, scores
+
+
+def read_genome_log(path):
+    """Lê o log binário, gerando (geração, scores, genomas) de cada bloco"""
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(CHUNK.size)
+            if len(header) < CHUNK.size:
+                return
+            generation, population_size, n_genes = CHUNK.unpack(header)
+            scores = np.fromfile(f, dtype='<f8', count=population_size)
+            genomes = np.fromfile(f, dtype='<f8', count=population_size * n_genes)
+            if len(genomes) < population_size * n_genes:
+                return  # Bloco incompleto (execução interrompida no meio da escrita)
+            yield generation, scores, genomes.reshape(population_size, n_genes)
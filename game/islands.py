@@ -0,0 +1,191 @@
+"""Modelo de ilhas: K populações evoluindo em processos separados, com migração"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from config import SCREEN_WIDTH, GROUND_Y, GENERATION_TIME, FPS, POPULATION_SIZE
+from genetic import GeneticAlgorithm
+from genome import population_matrix
+from seeds import MIGRATION_STREAM, make_seed, spawn_rng
+from simulation import SIMULATORS, spawn_apple
+
+TOPOLOGIES = ('ring', 'full')
+
+
+def migration_sources(topology, islands):
+    """Para cada ilha, de quais ilhas ela recebe migrantes"""
+    if topology == 'ring':
+        return [[(i - 1) % islands] for i in range(islands)] if islands > 1 else [[]]
+    if topology == 'full':
+        return [[j for j in range(islands) if j != i] for i in range(islands)]
+    raise ValueError(f"Topologia desconhecida: {topology!r} (use {TOPOLOGIES})")
+
+
+def island_seed(seed, island):
+    """Seed própria de cada ilha, derivada da seed da execução"""
+    return int(spawn_rng(seed, MIGRATION_STREAM, island).integers(2 ** 63))
+
+
+def run_epoch(task):
+    """Evolui uma ilha por algumas gerações no worker.
+
+    Recebe e devolve só a matriz de genomas (mais a geração e estatísticas
+    pequenas); o resto do estado do GA é derivado da seed da ilha.
+    """
+    seed, apple_seed, generation, genomes, generations, migrants, dt, generation_time, engine = task
+    simulate = SIMULATORS[engine]
+
+    ga = GeneticAlgorithm(population_size=len(genomes), seed=seed)
+    ga.generation = generation
+    ga.rng = spawn_rng(ga.seed, generation)
+    ga.genomes = np.array(genomes)
+    creatures = ga.spawn(SCREEN_WIDTH // 2, GROUND_Y)
+
+    history = []
+    best = None
+    for _ in range(generations):
+        # Todas as ilhas enfrentam a mesma maçã em cada geração
+        apple_pos = spawn_apple(apple_seed, ga.generation)
+        ticks = simulate(creatures, apple_pos, dt, generation_time)
+
+        stats = ga.get_statistics(creatures)
+        stats['generation'] = ga.generation
+        stats['alive'] = ga.stats.alive_count
+        stats['ticks'] = ticks
+        history.append(stats)
+
+        # Os melhores da última geração avaliada são os emigrantes
+        best = sorted(creatures, key=lambda c: c.score, reverse=True)[:migrants]
+        best = population_matrix(best)
+        creatures = ga.evolve(creatures, SCREEN_WIDTH // 2, GROUND_Y)
+
+    return ga.genomes, ga.generation, history, best
+
+
+class IslandModel:
+    """Evolui `islands` populações independentes, cada uma com seu `GeneticAlgorithm`.
+
+    As ilhas rodam `migrate_every` gerações por vez num `ProcessPoolExecutor`;
+    entre uma rodada e outra os `migrants` melhores genomas de cada ilha
+    substituem os últimos filhos (nunca a elite) das ilhas vizinhas na
+    topologia ('ring' ou 'full'). Só matrizes de genomas cruzam os processos,
+    e o resultado depende só da seed, nunca do número de workers.
+    """
+    def __init__(self, islands=4, population_size=POPULATION_SIZE, seed=None,
+                 migrate_every=5, migrants=2, topology='ring', workers=None,
+                 dt=1 / FPS, generation_time=GENERATION_TIME, engine='creature'):
+        self.seed = make_seed(seed)
+        self.migrate_every = migrate_every
+        self.migrants = migrants
+        self.sources = migration_sources(topology, islands)
+        self.topology = topology
+        self.dt = dt
+        self.generation_time = generation_time
+        self.engine = engine
+        self.generation = 1
+
+        # Estado de cada ilha no processo principal: seed e matriz de genomas
+        self.seeds = [island_seed(self.seed, i) for i in range(islands)]
+        self.genomes = []
+        for seed in self.seeds:
+            ga = GeneticAlgorithm(population_size=population_size, seed=seed)
+            ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+            self.genomes.append(ga.genomes)
+        self.elite_count = ga.elite_count
+
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    @property
+    def islands(self):
+        return len(self.seeds)
+
+    def run_epoch(self, generations=None):
+        """Evolui todas as ilhas em paralelo e faz a migração; retorna as estatísticas.
+
+        O resultado é uma lista (uma entrada por geração) de listas com as
+        estatísticas de cada ilha.
+        """
+        generations = generations or self.migrate_every
+        tasks = [
+            (seed, self.seed, self.generation, genomes, generations, self.migrants,
+             self.dt, self.generation_time, self.engine)
+            for seed, genomes in zip(self.seeds, self.genomes)
+        ]
+        if self._executor is None:
+            results = list(map(run_epoch, tasks))
+        else:
+            results = list(self._executor.map(run_epoch, tasks))
+
+        self.genomes = [genomes for genomes, _, _, _ in results]
+        self.generation = results[0][1]
+        self.migrate([best for _, _, _, best in results])
+        return [list(stats) for stats in zip(*(history for _, _, history, _ in results))]
+
+    def migrate(self, emigrants):
+        """Coloca os melhores de cada ilha de origem no fim da população de destino"""
+        new_genomes = []
+        for genomes, sources in zip(self.genomes, self.sources):
+            incoming = [emigrants[j] for j in sources]
+            if incoming:
+                genomes = genomes.copy()
+                incoming = np.concatenate(incoming)
+                # Nunca substitui a elite (primeiras linhas após o evolve)
+                room = max(0, len(genomes) - self.elite_count)
+                incoming = incoming[:room]
+                if len(incoming):
+                    genomes[len(genomes) - len(incoming):] = incoming
+            new_genomes.append(genomes)
+        self.genomes = new_genomes
+
+    def run(self, generations):
+        """Gera as estatísticas de cada geração até completar `generations`"""
+        done = 0
+        while done < generations:
+            epoch = min(self.migrate_every, generations - done)
+            for stats in self.run_epoch(epoch):
+                yield stats
+            done += epoch
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evolução com modelo de ilhas e migração")
+    parser.add_argument('-g', '--generations', type=int, default=20)
+    parser.add_argument('-p', '--population', type=int, default=POPULATION_SIZE,
+                        help="população de cada ilha")
+    parser.add_argument('-s', '--seed', type=int, default=None)
+    parser.add_argument('-k', '--islands', type=int, default=4)
+    parser.add_argument('-m', '--migrate-every', type=int, default=5)
+    parser.add_argument('--migrants', type=int, default=2)
+    parser.add_argument('-t', '--topology', choices=TOPOLOGIES, default='ring')
+    parser.add_argument('-w', '--workers', type=int, default=None)
+    parser.add_argument('-e', '--engine', choices=SIMULATORS, default='creature')
+    args = parser.parse_args()
+
+    with IslandModel(args.islands, args.population, args.seed, args.migrate_every,
+                     args.migrants, args.topology, args.workers,
+                     engine=args.engine) as model:
+        for stats in model.run(args.generations):
+            best = max(s['best'] for s in stats)
+            per_island = ' '.join(f"{s['best']:.2f}" for s in stats)
+            print(f"Geração {stats[0]['generation']}: melhor {best:.2f} | ilhas: {per_island}")
+        print(f"Seed: {model.seed}")
+
+
+if __name__ == '__main__':
+    main()
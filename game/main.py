@@ -1,12 +1,27 @@
-import pygame
-import random
-from components.background import Background
-from components.apple import Apple
-from components.platform import Platform
-from genetic import GeneticAlgorithm
+"""Jogo com janela: evolução das criaturas desenhada em tempo real.
+
+O pygame, os módulos de desenho e os assets só são carregados em `main()`;
+importar este módulo (ou o núcleo da simulação) não abre janela nenhuma.
+"""
+import os
+from time import perf_counter
 
-# Inicializa a instância do pygame
-pygame.init()
+import checkpoint
+from components.creature import Creature
+from components.spatial import SpatialIndex
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, GENERATION_TIME, FPS,
+                    POPULATION_SIZE, SEED, REPLAY_LOG, CHECKPOINT_PATH, CHECKPOINT_EVERY,
+                    PROFILE, PROFILE_EXPORT, METRICS_TARGET, METRICS_PER_FRAME, EARLY_STOP,
+                    HISTORY_LOG, HISTORY_GENOMES, CONTROL_ADDRESS)
+from control import SPEEDS, ControlServer
+from genetic import GeneticAlgorithm
+from history import HistoryLog, snapshot
+from metrics import MetricsSink
+from profiler import Profiler
+from replay import RunLog
+from scheduler import EvaluationScheduler
+from simulation import spawn_apple
+from tasks import BackgroundEvolver, BackgroundWriter
 
 # Predefinindo algumas cores
 BLUE  = (0, 0, 255)
@@ -16,193 +31,379 @@ BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
 GRAY  = (100, 100, 100)
 
-# Define o tamanho da tela
-SCREEN_WIDTH, SCREEN_HEIGHT = 1020, 680
+# Física com timestep fixo, independente do FPS: o acumulador guarda o tempo real
+# ainda não simulado e cada frame roda quantos ticks couberem (vezes a velocidade)
+SIM_DT = 1 / FPS
+MAX_LAG_TICKS = 4  # Se a máquina atrasar, descarta o excesso em vez de acumular
 
-# Cria a tela
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Genetic Algorithm - Evolução de Criaturas")
 
-# Configurações do jogo
-GROUND_Y = SCREEN_HEIGHT - 100
-GENERATION_TIME = 15  # segundos por geração
-FPS = 60
+def render_fitness_graph(history, font):
+    """Desenha o gráfico do histórico de fitness numa superfície própria"""
+    import pygame
 
-# Components
-bg = Background(SCREEN_WIDTH, SCREEN_HEIGHT)
+    graph_width = 300
+    graph_height = 100
+    title_height = 25
+    surface = pygame.Surface((graph_width, graph_height + title_height), pygame.SRCALPHA)
+    graph_y = title_height
+    
+    # Fundo do gráfico
+    pygame.draw.rect(surface, (30, 30, 30), (0, graph_y, graph_width, graph_height))
+    pygame.draw.rect(surface, WHITE, (0, graph_y, graph_width, graph_height), 1)
+    
+    # Título
+    graph_title = font.render("Evolução do Fitness", True, WHITE)
+    surface.blit(graph_title, (70, 0))
+    
+    # Desenha linha do gráfico (escala pelo máximo mantido pelo histórico)
+    max_fitness = history.max or 1
+    history_to_show = history[-50:]  # Últimas 50 gerações
+    
+    if len(history_to_show) > 1:
+        points = []
+        for i, fitness in enumerate(history_to_show):
+            x = (i / (len(history_to_show) - 1)) * graph_width
+            y = graph_y + graph_height - (fitness / max_fitness) * graph_height
+            points.append((x, y))
+        
+        if len(points) > 1:
+            pygame.draw.lines(surface, GREEN, False, points, 2)
+    
+    return surface
 
-# Spawn inicial aleatório da maçã (mantém margens para não sair da tela)
-apple_x = random.randint(50, SCREEN_WIDTH - 50)
-apple_y = 50
-apple = Apple(apple_x, apple_y)
 
-platform = Platform(GROUND_Y, SCREEN_WIDTH)
+def main():
+    """Abre a janela e roda o jogo até ela ser fechada"""
+    # Só a janela precisa do pygame, dos módulos de desenho e dos assets
+    import pygame
+    from components import assets
+    from components.apple import Apple
+    from components.background import Background
+    from components.platform import Platform
+    from renderer import Renderer
 
-# Algoritmo Genético
-ga = GeneticAlgorithm(population_size=100)
-creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    # Inicializa a instância do pygame
+    pygame.init()
 
-# Controles
-clock = pygame.time.Clock()
-generation_timer = 0
-paused = False
+    # Tamanho atual da janela (muda quando ela é redimensionada)
+    screen_width, screen_height = SCREEN_WIDTH, SCREEN_HEIGHT
 
-# Font para informações
-font = pygame.font.Font(None, 32)
-small_font = pygame.font.Font(None, 24)
+    # Cria a tela
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    pygame.display.set_caption("Genetic Algorithm - Evolução de Criaturas")
 
-# Loop principal
-running = True
-while running:
-    delta_time = clock.tick(FPS) / 1000.0  # Delta time em segundos
-    
+    # Pré-carrega os assets (o cache é compartilhado por todos os componentes)
+    assets.preload(screen_width, screen_height, GROUND_Y)
+
+    # Components
+    bg = Background(screen_width, screen_height)
 
+    platform = Platform(GROUND_Y, screen_width)
+
+    # Algoritmo Genético (todo o acaso vem da seed da execução)
+    if CHECKPOINT_PATH and os.path.exists(CHECKPOINT_PATH):
+        # Continua de onde a última execução parou
+        ga = GeneticAlgorithm.load_checkpoint(CHECKPOINT_PATH, track_stats=True)
+        creatures = ga.spawn(screen_width // 2, GROUND_Y)
+    else:
+        ga = GeneticAlgorithm(population_size=POPULATION_SIZE, seed=SEED, track_stats=True)
+        creatures = ga.create_population(screen_width // 2, GROUND_Y)
+    print(f"Seed: {ga.seed}, geração {ga.generation}")
+
+    # Spawn inicial aleatório da maçã (mantém margens para não sair da tela)
+    apple = Apple(*spawn_apple(ga.seed, ga.generation, screen_width))
+
+    # Orçamento da geração e fim antecipado quando todas as criaturas param
+    scheduler = EvaluationScheduler(GENERATION_TIME, early_stop=EARLY_STOP)
+
+    # Log de replay: seed + posição da maçã de cada geração
+    run_log = RunLog(ga.seed, ga.population_size, 1 / FPS, GENERATION_TIME,
+                     early_stop=scheduler.settings())
+    for generation in range(1, ga.generation):
+        run_log.record(spawn_apple(ga.seed, generation, screen_width))
+    run_log.record(apple.rect.center)
+
+    # Índice espacial para o empilhamento (reconstruído a cada tick)
+    spatial_index = SpatialIndex(max_speed=Creature.SPEED)
+
+    # Controles
+    clock = pygame.time.Clock()
+    paused = False
+
+    # Velocidades da simulação nas teclas 1-4
+    speeds = dict(zip((pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4), SPEEDS))  # None = máxima
+    speed = 1
+    accumulator = 0.0
+
+    # Font para informações
+    font = pygame.font.Font(None, 32)
+    small_font = pygame.font.Font(None, 24)
+
+    profile_font = pygame.font.Font(None, 20)
+
+    # Métricas gravadas em lote numa thread (por frame só se METRICS_PER_FRAME)
+    metrics = MetricsSink(METRICS_TARGET, per_frame=METRICS_PER_FRAME)
     stats = ga.get_statistics(creatures)
+    alive_count = ga.stats.alive_count
 
-    # Eventos
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        
-        elif event.type == pygame.VIDEORESIZE:
-            SCREEN_WIDTH = event.w
-            SCREEN_HEIGHT = event.h
-            screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-            bg = Background(SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                # Força todas as criaturas a pularem
-                for c in creatures:
-                    if c.alive:
-                        c.jump()
-            
-            elif event.key == pygame.K_p:
-                # Pausa/Resume
-                paused = not paused
-    
-    if not paused:
-        # Timer da geração
-        generation_timer += delta_time
-
-        # Atualiza criaturas
-        all_dead = True
-        best_creature = None
-        for creature in creatures:
-            if creature.alive:
-                all_dead = False
-                creature.update(
-                    apple.rect.center, 
-                    SCREEN_WIDTH, 
-                    SCREEN_HEIGHT,
-                    GROUND_Y,
-                    delta_time,
-                    creatures
-                )
-
-            # Identifica a melhor criatura
-            if best_creature is None or creature.score > best_creature.score:
-                best_creature = creature
-
-        # Marca a melhor criatura
-        for creature in creatures:
-            creature.is_best = (creature == best_creature)
-
-        # Evolui automaticamente quando todas morrerem ou tempo acabar
-        if (all_dead or generation_timer >= GENERATION_TIME):
-            
-            print(f"Geração {ga.generation}: {stats}")
-            
-            creatures = ga.evolve(creatures, SCREEN_WIDTH // 2, GROUND_Y)
+    # Log em disco das estatísticas (e opcionalmente dos genomas) de cada geração
+    history_log = HistoryLog(HISTORY_LOG, HISTORY_GENOMES) if HISTORY_LOG else None
+
+    # A próxima geração é criada numa thread enquanto o loop continua desenhando, e
+    # as gravações (histórico, checkpoints) vão para uma fila com a sua própria thread
+    evolver = BackgroundEvolver(ga)
+    writer = BackgroundWriter()
+
+    # Endpoint de controle opcional (estatísticas, velocidade e tamanho da população)
+    control = ControlServer(CONTROL_ADDRESS, ga.elite_count + 1) if CONTROL_ADDRESS else None
+    pending_population = None  # Novo tamanho, aplicado na próxima evolução
+
+    # Timers por fase do loop (F3 liga/desliga o overlay)
+    profiler = Profiler(enabled=PROFILE)
+    profile_lines = []
+
+    # Fundo e plataforma ficam pré-compostos numa camada estática
+    renderer = Renderer(screen, [bg, platform])
+
+
+    # Loop principal
+    running = True
+    frame = 0
+    marked_best = None  # Criatura que está com a coroa
+    while running:
+        delta_time = clock.tick(FPS) / 1000.0  # Delta time em segundos
+        frame += 1
+
+        # Eventos
+        with profiler.phase('events'):
+            events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+
+            elif event.type == pygame.VIDEORESIZE:
+                screen_width = event.w
+                screen_height = event.h
+                screen = pygame.display.set_mode((screen_width, screen_height), pygame.RESIZABLE)
+                bg = Background(screen_width, screen_height)
+                renderer.set_static(screen, [bg, platform])
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    # Força todas as criaturas a pularem
+                    for c in creatures:
+                        if c.alive:
+                            c.jump()
+
+                elif event.key == pygame.K_p:
+                    # Pausa/Resume
+                    paused = not paused
+
+                elif event.key == pygame.K_F3:
+                    # Liga/desliga o profiler e o overlay
+                    profiler.toggle()
+
+                elif event.key in speeds:
+                    # Velocidade da simulação (1x, 2x, 8x ou máxima)
+                    speed = speeds[event.key]
+                    accumulator = 0.0
+
+        # Comandos do endpoint de controle (nunca espera)
+        if control is not None:
+            for command, value in control.commands():
+                if command == 'speed':
+                    speed = value
+                    accumulator = 0.0
+                elif command == 'population':
+                    pending_population = value
+
+        # Troca de geração quando a evolução em segundo plano termina
+        with profiler.phase('evolve'):
+            population = evolver.poll()
+        if population is not None:
+            creatures = population
             # Respawna a maçã a cada nova geração para introduzir
             # variabilidade no ambiente (aleatoriedade no spawn)
-            apple_x = random.randint(50, SCREEN_WIDTH - 50)
-            apple_y = 50
-            apple.rect.center = (apple_x, apple_y)
-            generation_timer = 0
-    
-    # Desenha tudo
-    bg.draw(screen)
-    platform.draw(screen)
-    apple.draw(screen)
-    
-    # Desenha criaturas
-    for creature in creatures:
-        creature.draw(screen)
-    
-    # Informações na tela
-    # stats = ga.get_statistics(creatures)
+            apple.rect.center = spawn_apple(ga.seed, ga.generation, screen_width)
+            run_log.record(apple.rect.center)
+
+            # Checkpoint automático (a cópia do estado é gravada pela fila)
+            if CHECKPOINT_PATH and (ga.generation - 1) % CHECKPOINT_EVERY == 0:
+                writer.submit(checkpoint.save, CHECKPOINT_PATH, *ga.checkpoint_state())
+            stats = ga.get_statistics(creatures)
+            alive_count = ga.stats.alive_count
+            scheduler.start()
+
+        # Quantos ticks simular neste frame
+        if paused:
+            ticks = 0
+        elif speed is None:
+            # Velocidade máxima: simula até gastar o tempo de um frame (menos o desenho)
+            ticks = float('inf')
+            deadline = perf_counter() + 0.8 / FPS
+            accumulator = 0.0
+        else:
+            accumulator = min(accumulator + delta_time * speed, speed * MAX_LAG_TICKS * SIM_DT)
+            ticks = int(accumulator / SIM_DT)
+            accumulator -= ticks * SIM_DT
+
+        # Durante a evolução só desenha o último estado da geração que acabou
+        tick = 0
+        while (tick < ticks and not evolver.pending
+               and (speed is not None or perf_counter() < deadline)):
+            tick += 1
+
+            # Timer da geração
+            scheduler.tick(SIM_DT)
+
+            # Atualiza criaturas
+            with profiler.phase('update'):
+                spatial_index.rebuild(creatures)
+                for creature in creatures:
+                    if creature.alive:
+                        creature.update(
+                            apple.rect.center, 
+                            screen_width, 
+                            screen_height,
+                            GROUND_Y,
+                            SIM_DT,
+                            spatial_index
+                        )
+
+            with profiler.phase('best'):
+                # Melhor criatura vem do tracker incremental (sem varrer a população)
+                best_creature = ga.get_best_creature(creatures)
+                if best_creature is not marked_best:
+                    if marked_best is not None:
+                        marked_best.is_best = False
+                    if best_creature is not None:
+                        best_creature.is_best = True
+                    marked_best = best_creature
+
+            # Estatísticas: no máximo uma vez por tick (pausado, reaproveita as últimas)
+            stats = ga.get_statistics(creatures)
+            alive_count = ga.stats.alive_count
+            metrics.frame(frame, stats)
+
+            # Evolui automaticamente quando todas morrerem (ou pararem de mudar o
+            # score) ou o tempo acabar. Sem fim antecipado, as ativas são as vivas
+            # do tracker (sem varrer a população)
+            active = scheduler.settle(creatures) if scheduler.early_stop else alive_count
+            if active == 0 or scheduler.expired:
+
+                metrics.generation(ga.generation, stats)
+                profiler.end_generation(ga.generation)
+                if history_log is not None:
+                    writer.submit(history_log.write, ga.generation,
+                                  {**stats, 'alive': alive_count}, *snapshot(creatures))
+
+                if pending_population is not None:
+                    ga.population_size = pending_population
+                    pending_population = None
+                # Nasce no centro da largura atual (a janela pode ter sido redimensionada)
+                evolver.submit(creatures, screen_width // 2, GROUND_Y)
+
+        # Desenha tudo (só os retângulos que mudaram vão para a tela)
+        with profiler.phase('background'):
+            renderer.begin()
+            renderer.blit(apple.image, apple.rect)
+
+        # Desenha criaturas (um blit em lote com os sprites em cache), interpoladas
+        # entre os dois últimos ticks pelo tempo que sobrou no acumulador
+        alpha = 1.0 if speed is None else accumulator / SIM_DT
+        with profiler.phase('creatures'):
+            renderer.draw_creatures(creatures, alpha)
+
+        with profiler.phase('hud'):
+            # Geração
+            renderer.text('generation', font, f"Geração: {ga.generation}", WHITE, topleft=(10, 10))
+
+            # Tempo restante
+            time_left = scheduler.time_left
+            renderer.text('timer', font, f"Tempo: {time_left:.1f}s", WHITE, topleft=(10, 50))
+
+            # Melhor fitness
+            renderer.text('best', font, f"Melhor: {int(stats['best'])}", GREEN, topleft=(10, 90))
+
+            # Fitness médio
+            renderer.text('average', small_font, f"Média: {int(stats['average'])}", WHITE,
+                          topleft=(10, 130))
+
+            # Criaturas vivas
+            renderer.text('alive', small_font, f"Vivas: {alive_count}/{len(creatures)}", WHITE,
+                          topleft=(10, 160))
+
+            # Instruções
+            instructions = [
+                "ESPAÇO: Fazer criaturas pularem",
+                "P: Pausar/Continuar",
+                "F3: Profiler",
+                "1-4: Velocidade (1x/2x/8x/máx)",
+            ]
+
+            for i, instruction in enumerate(instructions):
+                renderer.text(('instruction', i), small_font, instruction, GRAY,
+                              topleft=(screen_width - 300, 10 + i * 30))
+
+            # Velocidade da simulação
+            speed_label = "máx" if speed is None else f"{speed}x"
+            renderer.text('speed', small_font, f"Velocidade: {speed_label}", WHITE,
+                          topleft=(10, 190))
+
+            # Indicador de pausa
+            if paused:
+                renderer.text('paused', font, "PAUSADO", RED, center=(screen_width // 2, 50))
+            elif evolver.pending:
+                renderer.text('evolving', font, "Evoluindo...", WHITE, center=(screen_width // 2, 50))
+
+            # Histórico de fitness (gráfico simples, re-renderizado só a cada geração)
+            if len(ga.best_fitness_history) > 1:
+                renderer.overlay('graph', ga.generation, lambda: render_fitness_graph(ga.best_fitness_history, small_font),
+                                 (screen_width - 320, screen_height - 175))
+
+            # Overlay do profiler (valores atualizados a cada meio segundo)
+            if profiler.enabled:
+                if frame % (FPS // 2) == 0:
+                    profile_lines = profiler.overlay_lines()
+                for i, line in enumerate(profile_lines):
+                    renderer.text(('profile', i), profile_font, line, WHITE, topleft=(10, 220 + i * 18))
+
+        # Atualiza a tela
+        with profiler.phase('flip'):
+            renderer.present()
+
+        if control is not None:
+            control.publish({**stats, 'generation': ga.generation, 'alive': alive_count,
+                             'population': len(creatures), 'speed': speed or 'max',
+                             'evolving': evolver.pending})
+
+    # Termina a evolução em andamento (o estado salvo já é o da próxima geração)
+    evolver.close()
+    if evolver.poll() is not None:
+        run_log.record(spawn_apple(ga.seed, ga.generation, screen_width))
+
+    if control is not None:
+        control.close()
+
+    metrics.close()
+
+    # Grava o que ficou na fila antes de fechar os arquivos
+    writer.close()
+    if history_log is not None:
+        history_log.close()
+
+    if REPLAY_LOG:
+        run_log.save(REPLAY_LOG)
+
+    if PROFILE_EXPORT:
+        profiler.export(PROFILE_EXPORT)
+
+    # Salva o estado ao sair (a geração atual recomeça do zero na próxima execução)
+    if CHECKPOINT_PATH:
+        ga.save_checkpoint(CHECKPOINT_PATH)
+
+    pygame.quit()
 
-    print(stats)
-    
-    # Geração
-    gen_text = font.render(f"Geração: {ga.generation}", True, WHITE)
-    screen.blit(gen_text, (10, 10))
-    
-    # Tempo restante
-    time_left = max(0, GENERATION_TIME - generation_timer)
-    timer_text = font.render(f"Tempo: {time_left:.1f}s", True, WHITE)
-    screen.blit(timer_text, (10, 50))
-    
-    # Melhor fitness
-    best_text = font.render(f"Melhor: {int(stats['best'])}", True, GREEN)
-    screen.blit(best_text, (10, 90))
-    
-    # Fitness médio
-    avg_text = small_font.render(f"Média: {int(stats['average'])}", True, WHITE)
-    screen.blit(avg_text, (10, 130))
-    
-    # Criaturas vivas
-    alive_count = sum(1 for c in creatures if c.alive)
-    alive_text = small_font.render(f"Vivas: {alive_count}/{len(creatures)}", True, WHITE)
-    screen.blit(alive_text, (10, 160))
-    
-    # Instruções
-    instructions = [
-        "ESPAÇO: Fazer criaturas pularem",
-        "P: Pausar/Continuar",
-    ]
-    
-    for i, instruction in enumerate(instructions):
-        text = small_font.render(instruction, True, GRAY)
-        screen.blit(text, (SCREEN_WIDTH - 300, 10 + i * 30))
-    
-    # Indicador de pausa
-    if paused:
-        pause_text = font.render("PAUSADO", True, RED)
-        pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-        screen.blit(pause_text, pause_rect)
-    
-    # Histórico de fitness (gráfico simples)
-    if len(ga.best_fitness_history) > 1:
-        graph_x = SCREEN_WIDTH - 320
-        graph_y = SCREEN_HEIGHT - 150
-        graph_width = 300
-        graph_height = 100
-        
-        # Fundo do gráfico
-        pygame.draw.rect(screen, (30, 30, 30), (graph_x, graph_y, graph_width, graph_height))
-        pygame.draw.rect(screen, WHITE, (graph_x, graph_y, graph_width, graph_height), 1)
-        
-        # Título
-        graph_title = small_font.render("Evolução do Fitness", True, WHITE)
-        screen.blit(graph_title, (graph_x + 70, graph_y - 25))
-        
-        # Desenha linha do gráfico
-        max_fitness = max(ga.best_fitness_history) if ga.best_fitness_history else 1
-        history_to_show = ga.best_fitness_history[-50:]  # Últimas 50 gerações
-        
-        if len(history_to_show) > 1:
-            points = []
-            for i, fitness in enumerate(history_to_show):
-                x = graph_x + (i / (len(history_to_show) - 1)) * graph_width
-                y = graph_y + graph_height - (fitness / max_fitness) * graph_height
-                points.append((x, y))
-            
-            if len(points) > 1:
-                pygame.draw.lines(screen, GREEN, False, points, 2)
-    
-    # Atualiza a tela
-    pygame.display.flip()
 
-pygame.quit()
+if __name__ == '__main__':
+    main()
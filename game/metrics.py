@@ -0,0 +1,111 @@
+"""Saída de métricas com buffer: o loop só enfileira, uma thread grava em lote"""
+import json
+import socket
+import sys
+import threading
+import time
+
+
+class MetricsSink:
+    """Enfileira registros e os grava em lote numa thread de fundo.
+
+    `target` pode ser um caminho de arquivo (JSON lines), '-' para stdout, uma
+    tupla (host, porta) para um socket TCP ou uma função chamada com a lista de
+    registros de cada lote. Registros por frame só são aceitos com `per_frame`
+    e no máximo um a cada `frame_interval` segundos.
+    """
+    def __init__(self, target='-', per_frame=False, frame_interval=0.1,
+                 flush_interval=1.0, batch_size=256):
+        self.per_frame = per_frame
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._frame_limiter = RateLimiter(frame_interval)
+        self._close_target = lambda: None
+        self._write = self._make_writer(target)
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='metrics-sink', daemon=True)
+        self._thread.start()
+
+    def _make_writer(self, target):
+        if callable(target):
+            return target
+
+        if isinstance(target, tuple):
+            conn = socket.create_connection(target)
+            self._close_target = conn.close
+            return lambda records: conn.sendall(self._encode(records))
+
+        if target == '-':
+            stream = sys.stdout
+            self._close_target = stream.flush
+        else:
+            stream = open(target, 'a', encoding='utf-8')
+            self._close_target = stream.close
+
+        def write(records):
+            stream.write(self._encode(records).decode('utf-8'))
+            stream.flush()
+        return write
+
+    @staticmethod
+    def _encode(records):
+        return ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in records).encode()
+
+    def emit(self, record):
+        """Enfileira um registro (não bloqueia o loop)"""
+        with self._lock:
+            self._buffer.append(record)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def frame(self, frame, stats):
+        """Registro por frame (opt-in e limitado por `frame_interval`)"""
+        if self.per_frame and self._frame_limiter.ready():
+            self.emit({'type': 'frame', 'frame': frame, **stats})
+
+    def generation(self, generation, stats):
+        self.emit({'type': 'generation', 'generation': generation, **stats})
+
+    def flush(self):
+        with self._lock:
+            records, self._buffer = self._buffer, []
+        if records:
+            self._write(records)
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Grava o que sobrou e encerra a thread"""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        self._close_target()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RateLimiter:
+    """Deixa passar no máximo um evento a cada `interval` segundos"""
+    def __init__(self, interval):
+        self.interval = interval
+        self._last = float('-inf')
+
+    def ready(self):
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            return True
+        return False
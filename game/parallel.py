@@ -0,0 +1,96 @@
+"""Avaliação de fitness em paralelo com um pool de processos"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from components.creature import Creature
+from config import GENERATION_TIME, FPS
+from genome import Genome, population_matrix
+from seeds import ISLAND_STREAM, make_seed, spawn_rng
+from simulation import SIMULATORS
+
+# Número padrão de ilhas: fixo para o resultado não depender da quantidade de workers
+DEFAULT_ISLANDS = 8
+
+
+def split_islands(population, islands):
+    """Divide a população em `islands` blocos contíguos (vizinhos continuam juntos)"""
+    islands = max(1, min(islands, len(population)))
+    size, extra = divmod(len(population), islands)
+    chunks = []
+    start = 0
+    for i in range(islands):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(population[start:end])
+        start = end
+    return chunks
+
+
+def evaluate_island(task):
+    """Roda uma geração headless para uma ilha e devolve só ticks, scores e vivos"""
+    ((seed, generation, island), spawns, genomes, target_pos, dt, generation_time, engine,
+     scheduler) = task
+
+    rng = spawn_rng(seed, generation, ISLAND_STREAM, island)
+    creatures = [Creature(x, y, Genome(row), rng) for (x, y), row in zip(spawns, genomes)]
+    ticks = SIMULATORS[engine](creatures, target_pos, dt, generation_time, scheduler=scheduler)
+    scores = [c.score for c in creatures]
+    alive = [c.alive for c in creatures]
+    return ticks, scores, alive
+
+
+class ParallelEvaluator:
+    """Avalia a população dividida em ilhas independentes num `ProcessPoolExecutor`.
+
+    Cada ilha é simulada sozinha (sem empilhamento entre ilhas) com uma seed
+    derivada de (seed, geração, ilha), então o resultado depende apenas de
+    `seed` e `islands`, nunca do número de workers.
+    """
+    def __init__(self, workers=None, islands=DEFAULT_ISLANDS, seed=None,
+                 dt=1 / FPS, generation_time=GENERATION_TIME, engine='creature',
+                 scheduler=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.islands = islands
+        self.seed = make_seed(seed)
+        self.dt = dt
+        self.generation_time = generation_time
+        self.engine = engine
+        self.scheduler = scheduler
+        self._executor = None
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def evaluate(self, population, target_pos, generation):
+        """Define `score` e `alive` de cada criatura, retorna o maior número de ticks"""
+        chunks = split_islands(population, self.islands)
+        tasks = [
+            ((self.seed, generation, i),
+             [(c.pos.x, c.pos.y) for c in chunk],
+             population_matrix(chunk),
+             target_pos, self.dt, self.generation_time, self.engine, self.scheduler)
+            for i, chunk in enumerate(chunks)
+        ]
+
+        if self._executor is None:
+            results = map(evaluate_island, tasks)
+        else:
+            results = self._executor.map(evaluate_island, tasks)
+
+        max_ticks = 0
+        # Os workers não mudam o DNA: as criaturas continuam nas linhas dos genomas
+        for chunk, (ticks, scores, alive) in zip(chunks, results):
+            max_ticks = max(max_ticks, ticks)
+            for i, creature in enumerate(chunk):
+                creature.score = scores[i]
+                creature.alive = alive[i]
+        return max_ticks
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,34 @@
+"""Pool de criaturas: os objetos são reaproveitados de uma geração para outra"""
+from components.creature import Creature
+from genome import Genome
+
+
+class CreaturePool:
+    """Reaproveita as criaturas entre gerações em vez de criar objetos novos.
+
+    Há `buffers` conjuntos de criaturas usados em rodízio: com 2, a geração
+    nova é montada no conjunto da penúltima enquanto a última continua
+    intacta (ela pode estar sendo desenhada ou gravada em outra thread).
+    Cada chamada de `population` devolve uma lista nova, então quem compara
+    populações por identidade não confunde duas gerações.
+    """
+    def __init__(self, buffers=2):
+        self._buffers = [[] for _ in range(buffers)]
+        self._turn = 0
+
+    def population(self, spawns, genomes, rng):
+        """Criaturas em `spawns` [(x, y)] com as linhas de `genomes` (visões, sem cópia)"""
+        slots = self._buffers[self._turn]
+        self._turn = (self._turn + 1) % len(self._buffers)
+
+        for i, ((x, y), row) in enumerate(zip(spawns, genomes)):
+            if i < len(slots):
+                slots[i].reset(x, y, row, rng)
+            else:
+                slots.append(Creature(x, y, Genome(row), rng))
+        # Sobras de uma população maior ficam guardadas para quando ela crescer de novo
+        return slots[:len(genomes)]
+
+    def __len__(self):
+        """Criaturas alocadas em todos os conjuntos"""
+        return sum(len(slots) for slots in self._buffers)
@@ -0,0 +1,122 @@
+"""Timers leves por fase do loop, com percentis móveis e exportação por geração"""
+import csv
+import json
+import sys
+from collections import deque
+from contextlib import nullcontext
+from time import perf_counter
+
+import numpy as np
+
+# Contexto vazio compartilhado: com o profiler desligado cada fase custa só um `with`
+_DISABLED = nullcontext()
+
+PERCENTILES = (50, 95, 99)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_memory_mb():
+    """Pico de memória residente do processo em MB (None onde não dá para medir)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KB, macOS em bytes
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+class _Phase:
+    """Timer de uma fase; guarda as últimas `window` durações (em ms) e as da geração atual"""
+    __slots__ = ('samples', 'generation', '_start')
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.generation = []
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = (perf_counter() - self._start) * 1000
+        self.samples.append(elapsed)
+        self.generation.append(elapsed)
+
+
+def _stats(samples):
+    """p50/p95/p99, média e contagem de uma lista de durações"""
+    samples = np.fromiter(samples, dtype=np.float64)
+    p50, p95, p99 = np.percentile(samples, PERCENTILES)
+    return {
+        'p50': float(p50),
+        'p95': float(p95),
+        'p99': float(p99),
+        'mean': float(samples.mean()),
+        'count': len(samples),
+    }
+
+
+class Profiler:
+    """Mede as fases do loop principal (eventos, update, evolve, desenho...).
+
+    Uso: `with profiler.phase('update'): ...`. As durações ficam numa janela
+    móvel de `window` amostras por fase, de onde saem os p50/p95/p99 do
+    overlay. A exportação usa só as amostras de cada geração.
+    """
+    def __init__(self, enabled=False, window=600):
+        self.enabled = enabled
+        self.window = window
+        self._phases = {}
+        self.generations = []  # Um resumo por geração, para exportar
+
+    def phase(self, name):
+        if not self.enabled:
+            return _DISABLED
+        timer = self._phases.get(name)
+        if timer is None:
+            timer = self._phases[name] = _Phase(self.window)
+        return timer
+
+    def toggle(self):
+        self.enabled = not self.enabled
+
+    def summary(self):
+        """{fase: {'p50', 'p95', 'p99', 'mean', 'count'}} da janela móvel, em milissegundos"""
+        return {name: _stats(timer.samples) for name, timer in self._phases.items()
+                if timer.samples}
+
+    def end_generation(self, generation):
+        """Guarda o resumo da geração que terminou (só as amostras dela)"""
+        for name, timer in self._phases.items():
+            if self.enabled and timer.generation:
+                self.generations.append({'generation': generation, 'phase': name,
+                                         **_stats(timer.generation)})
+            timer.generation = []
+
+    def export(self, path):
+        """Exporta os resumos por geração em CSV ou JSON (pela extensão)"""
+        if path.endswith('.json'):
+            with open(path, 'w') as f:
+                json.dump(self.generations, f, indent=2)
+            return
+
+        fields = ['generation', 'phase', 'p50', 'p95', 'p99', 'mean', 'count']
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.generations)
+
+    def overlay_lines(self):
+        """Linhas de texto para o overlay na tela"""
+        lines = [
+            f"{name:<10} p50 {s['p50']:6.2f}  p95 {s['p95']:6.2f}  p99 {s['p99']:6.2f} ms"
+            for name, s in self.summary().items()
+        ]
+        peak = peak_memory_mb()
+        if peak is not None:
+            lines.append(f"{'memória':<10} pico {peak:.1f} MB")
+        return lines
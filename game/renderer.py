@@ -0,0 +1,114 @@
+"""Renderização com camada estática em cache e atualização só dos retângulos sujos"""
+import pygame
+
+from components.sprites import draw_creatures
+
+
+class Renderer:
+    """Compõe fundo e plataforma numa superfície só e envia ao display só o que mudou.
+
+    A cada frame: `begin()` apaga (restaurando a camada estática) tudo que foi
+    desenhado no frame anterior, os objetos são redesenhados e `present()`
+    chama `display.update` apenas com os retângulos que mudaram.
+    """
+    def __init__(self, screen, static_layers):
+        self._texts = {}
+        self._overlays = {}
+        self.set_static(screen, static_layers)
+
+    def set_static(self, screen, static_layers):
+        """(Re)compõe a camada estática; o próximo frame é desenhado inteiro"""
+        self.screen = screen
+        self.static = pygame.Surface(screen.get_size()).convert()
+        for layer in static_layers:
+            layer.draw(self.static)
+
+        self._full_redraw = True
+        self._erase = []
+        self._moving = []
+        self._dirty = []
+        self._shown = set()
+
+    def begin(self):
+        """Restaura a camada estática onde algo foi desenhado no frame anterior"""
+        if self._full_redraw:
+            self.screen.blit(self.static, (0, 0))
+        else:
+            for rect in self._erase:
+                self.screen.blit(self.static, rect, rect)
+
+        # Posições antigas dos objetos em movimento também precisam ir para a tela
+        self._dirty = list(self._moving)
+        self._moving = []
+        self._erase = []
+        self._shown = set()
+
+    def blit(self, surface, pos):
+        """Desenha um objeto em movimento (sempre marcado como sujo)"""
+        rect = self.screen.blit(surface, pos)
+        self._moving.append(rect)
+        self._erase.append(rect)
+        return rect
+
+    def draw_creatures(self, creatures, alpha=1.0):
+        rects = draw_creatures(self.screen, creatures, alpha)
+        self._moving.extend(rects)
+        self._erase.extend(rects)
+
+    def text(self, key, font, text, color, **position):
+        """Texto do HUD: só chama `font.render` quando o valor muda"""
+        entry = self._texts.get(key)
+        anchor = tuple(sorted(position.items()))
+        if entry is None or entry[0] != (text, color, font, anchor):
+            if entry is not None and entry[0][:3] == (text, color, font):
+                surface = entry[1]  # Só mudou a posição (ex.: janela redimensionada)
+            else:
+                surface = font.render(text, True, color)
+            rect = surface.get_rect(**position)
+            if entry is not None:
+                self._dirty.append(entry[2])
+            self._dirty.append(rect)
+            entry = ((text, color, font, anchor), surface, rect)
+            self._texts[key] = entry
+
+        return self._draw_fixed(key, entry[1], entry[2])
+
+    def overlay(self, key, version, render, pos):
+        """Superfície fixa (ex.: gráfico) re-renderizada só quando `version` muda"""
+        entry = self._overlays.get(key)
+        pos = tuple(pos)
+        if entry is None or entry[0] != (version, pos):
+            if entry is not None and entry[0][0] == version:
+                surface = entry[1]  # Só mudou a posição
+            else:
+                surface = render()
+            rect = surface.get_rect(topleft=pos)
+            if entry is not None:
+                self._dirty.append(entry[2])
+            self._dirty.append(rect)
+            entry = ((version, pos), surface, rect)
+            self._overlays[key] = entry
+
+        return self._draw_fixed(key, entry[1], entry[2])
+
+    def _draw_fixed(self, key, surface, rect):
+        self.screen.blit(surface, rect)
+        self._erase.append(rect)
+        self._shown.add(key)
+        return rect
+
+    def present(self):
+        """Envia para o display só os retângulos sujos"""
+        # Posições novas dos objetos em movimento
+        self._dirty.extend(self._moving)
+
+        # Textos e overlays que deixaram de ser desenhados neste frame
+        for cache in (self._texts, self._overlays):
+            for key in [k for k in cache if k not in self._shown]:
+                self._dirty.append(cache.pop(key)[2])
+
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._dirty)
@@ -0,0 +1,93 @@
+"""Log de replay compacto: seed + posição da maçã de cada geração"""
+import argparse
+import json
+
+from config import GENERATION_TIME, FPS, POPULATION_SIZE
+
+
+class RunLog:
+    """Tudo que é preciso para regenerar exatamente qualquer geração de uma execução"""
+    def __init__(self, seed=None, population_size=POPULATION_SIZE, dt=1 / FPS,
+                 generation_time=GENERATION_TIME, engine='creature', islands=None,
+                 apples=None, early_stop=None, scenarios=None):
+        self.seed = seed
+        self.population_size = population_size
+        self.dt = dt
+        self.generation_time = generation_time
+        self.engine = engine
+        self.islands = islands  # None = avaliação serial
+        self.apples = list(apples or [])
+        self.early_stop = early_stop  # Parâmetros do fim antecipado (None = desligado)
+        self.scenarios = scenarios  # Avaliação com várias maçãs (None = uma só)
+
+    def record(self, apple_pos):
+        """Registra a posição da maçã da próxima geração"""
+        self.apples.append(tuple(apple_pos))
+
+    @property
+    def generations(self):
+        return len(self.apples)
+
+    def to_dict(self):
+        return {
+            'seed': self.seed,
+            'population_size': self.population_size,
+            'dt': self.dt,
+            'generation_time': self.generation_time,
+            'engine': self.engine,
+            'islands': self.islands,
+            'apples': [list(a) for a in self.apples],
+            'early_stop': self.early_stop,
+            'scenarios': self.scenarios,
+        }
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(**json.load(f))
+
+
+def replay(log, generation):
+    """Regenera a geração `generation` do log, retorna (ga, criaturas, estatísticas)"""
+    # Import local: headless importa este módulo
+    from headless import iter_generations
+    from scenarios import ScenarioEvaluator
+    from scheduler import EvaluationScheduler
+
+    if not 1 <= generation <= log.generations:
+        raise ValueError(f"Geração {generation} fora do log (1..{log.generations})")
+
+    workers = None if log.islands is None else 1
+    islands = log.islands or 1
+    scheduler = None
+    if log.early_stop is not None:
+        scheduler = EvaluationScheduler(log.generation_time, **log.early_stop)
+    scenarios = None
+    if log.scenarios is not None:
+        scenarios = ScenarioEvaluator(**log.scenarios, seed=log.seed, dt=log.dt,
+                                      generation_time=log.generation_time, scheduler=scheduler)
+    result = None
+    for result in iter_generations(generation, log.population_size, log.seed, log.dt,
+                                   log.generation_time, log.engine, workers, islands,
+                                   apples=log.apples, scheduler=scheduler,
+                                   scenarios=scenarios):
+        pass
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenera uma geração a partir do log")
+    parser.add_argument('log')
+    parser.add_argument('generation', type=int)
+    args = parser.parse_args()
+
+    _, _, stats = replay(RunLog.load(args.log), args.generation)
+    print(f"Geração {stats['generation']}: {stats}")
+
+
+if __name__ == '__main__':
+    main()
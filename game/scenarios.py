@@ -0,0 +1,105 @@
+"""Avaliação em vários cenários: cada genoma enfrenta K maçãs numa passada só"""
+import numpy as np
+
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, GENERATION_TIME, FPS,
+                    APPLE_Y, APPLE_MARGIN)
+from engine import GENES, PopulationEngine
+from genome import population_matrix
+from scheduler import EvaluationScheduler
+from seeds import APPLE_STREAM, spawn_rng
+
+# Como juntar os scores dos K cenários de cada genoma
+AGGREGATES = {
+    'mean': np.mean,
+    'min': np.min,  # Pior caso
+}
+
+
+def scenario_apples(seed, generation, scenarios, width=SCREEN_WIDTH):
+    """Posições (K x 2) das maçãs da geração, uma por cenário"""
+    apples = np.empty((scenarios, 2))
+    for k in range(scenarios):
+        rng = spawn_rng(seed, generation, APPLE_STREAM, k)
+        apples[k] = (rng.integers(APPLE_MARGIN, width - APPLE_MARGIN, endpoint=True), APPLE_Y)
+    return apples
+
+
+def simulate_scenarios(genes, spawns, apples, dt=1 / FPS, generation_time=GENERATION_TIME,
+                       width=SCREEN_WIDTH, height=SCREEN_HEIGHT, ground_y=GROUND_Y,
+                       scheduler=None):
+    """Simula N genomas contra K maçãs num único `PopulationEngine` de K*N criaturas.
+
+    Retorna (scores, vivos, ticks), com scores e vivos no formato (K, N).
+    """
+    scheduler = scheduler or EvaluationScheduler(generation_time, early_stop=False)
+    scheduler.start()
+    n, k = len(genes), len(apples)
+    spawns = np.asarray(spawns, dtype=np.float64).reshape(n, 2)
+
+    # Linha j*N + i: genoma i no cenário j
+    engine = PopulationEngine(np.tile(genes, (k, 1)), np.tile(spawns[:, 0], k),
+                              np.tile(spawns[:, 1], k))
+    targets = np.repeat(np.asarray(apples, dtype=np.float64), n, axis=0)
+    ticks = 0
+
+    while not scheduler.expired:
+        scheduler.tick(dt)
+        if not engine.alive.any():
+            break
+        engine.step(targets, width, height, ground_y, dt)
+        ticks += 1
+
+        if scheduler.settle_engine(engine) == 0:
+            break
+
+    return engine.score.reshape(k, n), engine.alive.reshape(k, n), ticks
+
+
+class ScenarioEvaluator:
+    """Avaliador plugável no `GeneticAlgorithm`: fitness agregado de K cenários.
+
+    Cada criatura é simulada contra `scenarios` maçãs sorteadas de (seed,
+    geração) com o motor vetorizado (sem empilhamento) e o score final é a
+    média ou o pior caso (`aggregate`). Uma criatura só conta como viva se
+    sobreviveu em todos os cenários.
+    """
+    def __init__(self, scenarios=4, aggregate='mean', seed=None, dt=1 / FPS,
+                 generation_time=GENERATION_TIME, scheduler=None):
+        self.scenarios = scenarios
+        self.aggregate = aggregate
+        self._aggregate = AGGREGATES[aggregate]
+        self.seed = seed
+        self.dt = dt
+        self.generation_time = generation_time
+        self.scheduler = scheduler
+        self._evaluated = None  # Última população avaliada (para não simular duas vezes)
+        self._scores = None
+
+    def apples(self, generation):
+        return scenario_apples(self.seed, generation, self.scenarios)
+
+    def evaluate(self, population, generation):
+        """Define `score` e `alive` de cada criatura, retorna o número de ticks"""
+        genes = population_matrix(population)[:, :len(GENES)]
+        spawns = [(c.pos.x, c.pos.y) for c in population]
+        scores, alive, ticks = simulate_scenarios(genes, spawns, self.apples(generation),
+                                                  self.dt, self.generation_time,
+                                                  scheduler=self.scheduler)
+
+        self._scores = self._aggregate(scores, axis=0)
+        alive = alive.all(axis=0)
+        for i, creature in enumerate(population):
+            creature.score = float(self._scores[i])
+            creature.alive = bool(alive[i])
+        self._evaluated = population
+        return ticks
+
+    def scores(self, population, generation):
+        """Scores agregados da população (avalia se ainda não foi avaliada)"""
+        if self._evaluated is not population:
+            self.evaluate(population, generation)
+        return self._scores
+
+    def settings(self):
+        """Parâmetros para o log de replay"""
+        return {'scenarios': self.scenarios, 'aggregate': self.aggregate}
@@ -0,0 +1,67 @@
+"""Agenda da avaliação: orçamento de tempo por geração e fim antecipado"""
+import numpy as np
+
+from config import GENERATION_TIME, EARLY_STOP_PATIENCE, EARLY_STOP_EPSILON
+
+
+class EvaluationScheduler:
+    """Decide quando a geração acaba e congela as criaturas que não mudam mais.
+
+    A geração acaba quando o orçamento `budget` (segundos simulados) esgota ou
+    quando não sobra nenhuma criatura ativa. Com `early_stop`, uma criatura
+    que está no chão, já pulou, andou menos de `move_epsilon` e teve o score
+    variando menos de `epsilon` por `patience` ticks seguidos é congelada:
+    `update` passa a ignorá-la e ela deixa de contar como ativa.
+    """
+    def __init__(self, budget=GENERATION_TIME, patience=EARLY_STOP_PATIENCE,
+                 epsilon=EARLY_STOP_EPSILON, move_epsilon=0.25, early_stop=True):
+        self.budget = budget
+        self.patience = patience
+        self.epsilon = epsilon
+        self.move_epsilon = move_epsilon
+        self.early_stop = early_stop
+        self.start()
+
+    def start(self):
+        """Zera o relógio para uma nova geração"""
+        self.elapsed = 0.0
+
+    def tick(self, dt):
+        self.elapsed += dt
+
+    @property
+    def expired(self):
+        return self.elapsed >= self.budget
+
+    @property
+    def time_left(self):
+        return max(0, self.budget - self.elapsed)
+
+    def settle(self, creatures):
+        """Congela as criaturas paradas; retorna quantas continuam ativas.
+
+        Varre a população inteira: sem `early_stop` os loops usam a contagem
+        de vivas que já têm em vez de chamar este método a cada tick.
+        """
+        active = 0
+        for creature in creatures:
+            if not creature.alive:
+                continue
+            if self.early_stop:
+                creature.settle(self.patience, self.epsilon, self.move_epsilon)
+            if not creature.frozen:
+                active += 1
+        return active
+
+    def settle_engine(self, engine):
+        """Mesmo que `settle`, para o `PopulationEngine`"""
+        if self.early_stop:
+            engine.settle(self.patience, self.epsilon, self.move_epsilon)
+        return int(np.count_nonzero(engine.alive & ~engine.frozen))
+
+    def settings(self):
+        """Parâmetros do fim antecipado (None se desligado), para o log de replay"""
+        if not self.early_stop:
+            return None
+        return {'patience': self.patience, 'epsilon': self.epsilon,
+                'move_epsilon': self.move_epsilon}
@@ -0,0 +1,23 @@
+"""RNG explícito e divisível: uma seed por execução, derivada por geração/ilha/criatura"""
+import numpy as np
+
+# Streams auxiliares (últimas chaves da derivação)
+APPLE_STREAM = 1
+ISLAND_STREAM = 2
+SPAWN_STREAM = 3
+MIGRATION_STREAM = 4
+
+# Usado só quando nenhum RNG é passado explicitamente
+DEFAULT_RNG = np.random.default_rng()
+
+
+def make_seed(seed=None):
+    """Seed concreta da execução (sorteada se None, para poder ser registrada)"""
+    if seed is None:
+        return int(np.random.SeedSequence().entropy)
+    return int(seed)
+
+
+def spawn_rng(seed, *keys):
+    """Gerador independente e reprodutível para (seed, *keys), ex.: (seed, geração, criatura)"""
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=keys))
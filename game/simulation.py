@@ -0,0 +1,245 @@
+"""Física de uma geração com timestep fixo, compartilhada pelos modos sem janela"""
+import numpy as np
+
+from analytic import Trajectories, mark_contacts
+from components.creature import Creature
+from components.spatial import SpatialIndex
+from config import (SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, GENERATION_TIME, FPS,
+                    APPLE_Y, APPLE_MARGIN)
+from engine import GENES, PopulationEngine
+from genome import population_matrix
+from scheduler import EvaluationScheduler
+from seeds import APPLE_STREAM, spawn_rng
+
+
+def spawn_apple(seed, generation, width=SCREEN_WIDTH):
+    """Posição da maçã da geração, sorteada do stream próprio (seed, geração)"""
+    rng = spawn_rng(seed, generation, APPLE_STREAM)
+    return (int(rng.integers(APPLE_MARGIN, width - APPLE_MARGIN, endpoint=True)), APPLE_Y)
+
+
+def simulate_generation(creatures, target_pos, dt=1 / FPS, generation_time=GENERATION_TIME,
+                        width=SCREEN_WIDTH, height=SCREEN_HEIGHT, ground_y=GROUND_Y,
+                        scheduler=None):
+    """Roda a física de uma geração com timestep fixo, retorna o número de ticks.
+
+    Sem `scheduler` a geração dura `generation_time` (ou até todas morrerem);
+    com um `EvaluationScheduler` valem o orçamento e o fim antecipado dele.
+    """
+    scheduler = scheduler or EvaluationScheduler(generation_time, early_stop=False)
+    scheduler.start()
+    return _simulate_ticks(creatures, target_pos, dt, width, height, ground_y, scheduler,
+                           SpatialIndex(max_speed=Creature.SPEED), 0)
+
+
+def _simulate_ticks(creatures, target_pos, dt, width, height, ground_y, scheduler, index,
+                    ticks):
+    """Loop de `simulate_generation` a partir do relógio atual de `scheduler`"""
+    # Mesmo critério do loop principal: acaba quando todas morrem (ou param) ou o tempo esgota
+    while not scheduler.expired:
+        scheduler.tick(dt)
+        if not _update_all(creatures, target_pos, dt, width, height, ground_y, index):
+            break
+        ticks += 1
+
+        # Sem fim antecipado ninguém congela: as vivas já bastam
+        if scheduler.early_stop and scheduler.settle(creatures) == 0:
+            break
+
+    return ticks
+
+
+def _update_all(creatures, target_pos, dt, width, height, ground_y, index):
+    """Um tick de `Creature.update` para as vivas; retorna False se não havia nenhuma"""
+    index.rebuild(creatures)
+    any_alive = False
+    for creature in creatures:
+        if creature.alive:
+            any_alive = True
+            creature.update(target_pos, width, height, ground_y, dt, index)
+    return any_alive
+
+
+def simulate_generation_vectorized(creatures, target_pos, dt=1 / FPS,
+                                   generation_time=GENERATION_TIME, width=SCREEN_WIDTH,
+                                   height=SCREEN_HEIGHT, ground_y=GROUND_Y, scheduler=None):
+    """Mesmo que `simulate_generation`, mas com o `PopulationEngine` (sem empilhamento)"""
+    scheduler = scheduler or EvaluationScheduler(generation_time, early_stop=False)
+    scheduler.start()
+    engine = PopulationEngine.from_creatures(creatures)
+    ticks = 0
+
+    while not scheduler.expired:
+        scheduler.tick(dt)
+        if not engine.alive.any():
+            break
+        engine.step(target_pos, width, height, ground_y, dt)
+        ticks += 1
+
+        if scheduler.settle_engine(engine) == 0:
+            break
+
+    engine.write_back(creatures)
+    return ticks
+
+
+# Fração da população no grupo com física completa a partir da qual simular
+# todas as criaturas sai mais barato que conferir contatos a cada tick
+FULL_SIMULATION_SHARE = 0.05
+
+
+def simulate_generation_analytic(creatures, target_pos, dt=1 / FPS,
+                                 generation_time=GENERATION_TIME, width=SCREEN_WIDTH,
+                                 height=SCREEN_HEIGHT, ground_y=GROUND_Y, scheduler=None):
+    """Mesmo resultado de `simulate_generation`, sem simular quem não se empilha.
+
+    Todas começam no roteiro em lote de `analytic.Trajectories`. A cada tick,
+    as que podem se empilhar (com outra do roteiro ou com o grupo) entram no
+    grupo simulado com `Creature.update`, a partir do estado do tick anterior,
+    e o tick é refeito. Quando o grupo passa de `FULL_SIMULATION_SHARE` da
+    população, a geração continua com a física completa para todas, do tick
+    em que está. Com o fim antecipado ligado (depende do score tick a tick) ou
+    criaturas que não estão recém-criadas, usa `simulate_generation`.
+    """
+    scheduler = scheduler or EvaluationScheduler(generation_time, early_stop=False)
+    if (not creatures or scheduler.early_stop
+            or not all(_is_fresh(c, ground_y) for c in creatures)):
+        return simulate_generation(creatures, target_pos, dt, generation_time,
+                                   width, height, ground_y, scheduler)
+
+    genes = population_matrix(creatures)[:, :len(GENES)]
+    trajectories = Trajectories(genes, [c.pos.x for c in creatures], target_pos, dt,
+                                scheduler.budget, width, ground_y)
+    index = SpatialIndex(max_speed=Creature.SPEED)
+    limit = len(creatures) * FULL_SIMULATION_SHARE
+    group = np.zeros(0, dtype=np.int64)  # Ids (em ordem) com a física completa
+    members = []
+    contact = np.zeros(len(creatures), dtype=bool)
+
+    scheduler.start()
+    ticks = 0
+    while not scheduler.expired:
+        scheduler.tick(dt)
+        if not len(trajectories.idx) and not any(c.alive for c in members):
+            break
+
+        state = trajectories.advance()
+        saved = [c.save_state() for c in members]
+        while True:
+            _step_group(contact, state, group, members, trajectories, target_pos, dt, width,
+                        height, ground_y, index)
+            if not contact.any():
+                break
+            new = np.flatnonzero(contact)
+            contact[:] = False
+            for creature, snapshot in zip(members, saved):
+                creature.restore_state(snapshot)
+
+            if len(group) + len(new) > limit:
+                # Grupo grande demais: todas passam para a física completa
+                # neste mesmo tick (a ordem de atualização é a original)
+                _materialize(creatures, trajectories, _outside(len(creatures), group))
+                _update_all(creatures, target_pos, dt, width, height, ground_y, index)
+                return _simulate_ticks(creatures, target_pos, dt, width, height, ground_y,
+                                       scheduler, index, ticks + 1)
+
+            _materialize(creatures, trajectories, new)
+            trajectories.remove(new)
+            keep = ~np.isin(state[0], new)
+            state = tuple(a[keep] for a in state)
+            group = np.sort(np.concatenate([group, new]))
+            members = [creatures[i] for i in group]
+            saved = [c.save_state() for c in members]
+        trajectories.commit()
+        ticks += 1
+
+    outside = _outside(len(creatures), group)
+    _write_results([creatures[i] for i in outside], trajectories.scores()[outside],
+                   trajectories.alive[outside])
+    return ticks
+
+
+def _is_fresh(creature, ground_y):
+    """Se a criatura está como saiu do spawn (o caminho analítico parte desse estado)"""
+    return (creature.alive and not creature.frozen and not creature.has_jumped
+            and not creature.on_ground and creature.standing_on is None
+            and creature.jump_timer == 0 and creature.vel.y == 0
+            and creature.pos.y == ground_y)
+
+
+def _outside(n, group):
+    """Ids das `n` criaturas que não estão no grupo"""
+    return np.flatnonzero(~np.isin(np.arange(n), group))
+
+
+def _materialize(creatures, trajectories, ids):
+    """Leva para as criaturas `ids` o estado delas em `trajectories` (tick anterior)"""
+    for i, state in zip(ids, trajectories.states(ids)):
+        creature = creatures[i]
+        creature.pos.update(state['x'], state['y'])
+        creature.prev_pos.update(state['x'], state['y'])
+        creature.vel.y = state['vel_y']
+        creature.jump_timer = state['jump_timer']
+        creature.has_jumped = state['has_jumped']
+        creature.on_ground = state['on_ground']
+        creature.can_jump = state['can_jump']
+        creature.alive = state['alive']
+        creature.score = state['score']
+
+
+def _write_results(creatures, scores, alive):
+    """Copia os resultados do caminho analítico para as criaturas"""
+    for i, creature in enumerate(creatures):
+        # Score zerado vira o 0 inteiro de `max(0, score)`, como em `Creature.update`
+        creature.score = float(scores[i]) or 0
+        creature.alive = bool(alive[i])
+
+
+def _step_group(contact, state, group, members, trajectories, target_pos, dt, width, height,
+                ground_y, index):
+    """Roda um tick do grupo e marca em `contact` quem do roteiro pode se empilhar.
+
+    `state` é o tick pendente de `Trajectories.advance`; o grupo entra no
+    teste com ids negativos (já está na física completa, não é marcado).
+    """
+    if not members:
+        ids, xb, xa, yb, ya, in_air, body, height_ = state
+        if in_air.any():
+            mark_contacts(contact, ids, xb, xa, yb, ya, in_air, ya, ya, body, height_)
+        return
+
+    alive = np.array([c.alive for c in members])
+    x_before = np.array([c.pos.x for c in members])
+    y_before = np.array([c.pos.y for c in members])
+    _update_all(members, target_pos, dt, width, height, ground_y, index)
+    x = np.array([c.pos.x for c in members])
+    y = np.array([c.pos.y for c in members])
+    snapped = np.array([c.standing_on is not None for c in members])
+    # Caía no teste de empilhamento se encostou em outra ou continua descendo;
+    # quem encostou subiu depois do teste, que foi entre a altura final e a
+    # queda máxima a partir do tick anterior
+    falling = alive & (snapped | np.array([c.vel.y > 0 for c in members]))
+    ids, xb, xa, yb, ya, in_air, body, height_ = state
+    if not in_air.any() and not falling.any():
+        return
+    fall_high = np.where(snapped,
+                         np.maximum(y, y_before + PopulationEngine.MAX_FALL_SPEED), y)
+    k = np.flatnonzero(alive)
+    mark_contacts(contact,
+                  np.concatenate([ids, -1 - k]),
+                  np.concatenate([xb, x_before[k]]),
+                  np.concatenate([xa, x[k]]),
+                  np.concatenate([yb, y_before[k]]),
+                  np.concatenate([ya, y[k]]),
+                  np.concatenate([in_air, falling[k]]),
+                  np.concatenate([ya, y[k]]),
+                  np.concatenate([ya, fall_high[k]]),
+                  np.concatenate([body, trajectories.body[group[k]]]),
+                  np.concatenate([height_, trajectories.total_height[group[k]]]))
+
+
+SIMULATORS = {
+    'creature': simulate_generation,
+    'vector': simulate_generation_vectorized,
+    'analytic': simulate_generation_analytic,
+}
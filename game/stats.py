@@ -0,0 +1,160 @@
+"""Estatísticas incrementais da população (melhor, pior, média, mediana, vivas)"""
+import heapq
+
+LOW, HIGH = 0, 1
+
+
+class PopulationStats:
+    """Mantém as estatísticas atualizadas a cada mudança de `score`/`alive`.
+
+    As criaturas avisam o tracker pelos setters de `score` e `alive`. A média
+    e o número de vivas custam O(1) por atualização; melhor, pior e mediana
+    (duas heaps) custam O(log n), com remoção preguiçosa das entradas antigas.
+    """
+    def __init__(self, population=()):
+        self.reset(population)
+
+    def reset(self, population, attach=True):
+        """Passa a acompanhar `population` (desliga o tracker anterior das criaturas).
+
+        Com `attach=False` só calcula as estatísticas dos scores atuais, sem
+        ligar o tracker: as criaturas não pagam nada por tick.
+        """
+        self.population = population
+        self._scores = [c.score for c in population]
+        self._alive = [c.alive for c in population]
+        self.alive_count = sum(self._alive)
+        if attach:
+            for i, creature in enumerate(population):
+                creature.track(self, i)
+        self._rebuild()
+
+    def _rebuild(self):
+        """Reconstrói as heaps só com as entradas válidas"""
+        n = len(self._scores)
+        self.total = sum(self._scores)
+        self._version = [0] * n
+        entries = sorted((s, i, 0) for i, s in enumerate(self._scores))
+
+        self._max = [(-s, i, v) for s, i, v in entries]
+        self._min = list(entries)
+        heapq.heapify(self._max)
+
+        # Mediana: metade de baixo numa max-heap, metade de cima numa min-heap
+        half = (n + 1) // 2
+        self._low = [(-s, i, v) for s, i, v in entries[:half]]
+        self._high = entries[half:]
+        heapq.heapify(self._low)
+        self._side = [LOW] * n
+        for _, i, _ in self._high:
+            self._side[i] = HIGH
+        self._low_size = half
+        self._high_size = n - half
+
+    def __len__(self):
+        return len(self._scores)
+
+    def update_score(self, i, score):
+        old = self._scores[i]
+        if score == old:
+            return
+        self._scores[i] = score
+        self.total += score - old
+        self._version[i] += 1
+        version = self._version[i]
+
+        heapq.heappush(self._max, (-score, i, version))
+        heapq.heappush(self._min, (score, i, version))
+
+        # Remove da metade onde estava e insere de novo
+        if self._side[i] == LOW:
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+
+        low_top = self._top(self._low, LOW)
+        if low_top is None or score <= -low_top[0]:
+            heapq.heappush(self._low, (-score, i, version))
+            self._side[i] = LOW
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, (score, i, version))
+            self._side[i] = HIGH
+            self._high_size += 1
+        self._balance()
+
+        # Compacta quando as entradas antigas passam do dobro da população
+        if len(self._max) > 2 * len(self._scores) + 64:
+            self._rebuild()
+
+    def update_alive(self, i, alive):
+        if alive != self._alive[i]:
+            self._alive[i] = alive
+            self.alive_count += 1 if alive else -1
+
+    def _valid(self, entry, side):
+        _, i, version = entry
+        return self._version[i] == version and self._side[i] == side
+
+    def _top(self, heap, side):
+        while heap and not self._valid(heap[0], side):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _top_extreme(self, heap):
+        while heap and heap[0][2] != self._version[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _balance(self):
+        while self._low_size > self._high_size + 1:
+            s, i, v = self._top(self._low, LOW)
+            heapq.heappop(self._low)
+            heapq.heappush(self._high, (-s, i, v))
+            self._side[i] = HIGH
+            self._low_size -= 1
+            self._high_size += 1
+        while self._high_size > self._low_size:
+            s, i, v = self._top(self._high, HIGH)
+            heapq.heappop(self._high)
+            heapq.heappush(self._low, (-s, i, v))
+            self._side[i] = LOW
+            self._high_size -= 1
+            self._low_size += 1
+
+    @property
+    def best(self):
+        top = self._top_extreme(self._max)
+        return -top[0] if top else 0
+
+    @property
+    def best_creature(self):
+        """Primeira criatura (na ordem da população) com o maior score"""
+        top = self._top_extreme(self._max)
+        return self.population[top[1]] if top else None
+
+    @property
+    def worst(self):
+        top = self._top_extreme(self._min)
+        return top[0] if top else 0
+
+    @property
+    def mean(self):
+        return self.total / len(self._scores) if self._scores else 0
+
+    @property
+    def median(self):
+        if not self._scores:
+            return 0
+        low = -self._top(self._low, LOW)[0]
+        if self._low_size > self._high_size:
+            return low
+        return (low + self._top(self._high, HIGH)[0]) / 2
+
+    def summary(self):
+        return {
+            'best': round(self.best, 2),
+            'worst': round(self.worst, 2),
+            'average': round(self.mean, 2),
+            'median': round(self.median, 2)
+        }
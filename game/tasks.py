@@ -0,0 +1,84 @@
+"""Trabalho fora do loop do jogo: evolução numa thread e fila de gravações em disco"""
+import queue
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundEvolver:
+    """Roda `ga.evolve` numa thread para o loop continuar desenhando.
+
+    Enquanto a próxima geração está sendo criada (`pending`), o loop não deve
+    mexer no algoritmo nem nas criaturas da geração que acabou: só desenha o
+    último estado. `poll` devolve a nova população quando ela fica pronta.
+    """
+    def __init__(self, ga):
+        self.ga = ga
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='evolve')
+        self._future = None
+
+    @property
+    def pending(self):
+        return self._future is not None
+
+    def submit(self, population, spawn_x, spawn_y):
+        """Começa a evoluir `population`, com a próxima geração nascendo em (x, y)"""
+        if self._future is not None:
+            raise RuntimeError("já existe uma evolução em andamento")
+        self._future = self._executor.submit(self.ga.evolve, population, spawn_x, spawn_y)
+
+    def poll(self):
+        """Nova população se a evolução terminou (None se ainda está rodando)"""
+        if self._future is None or not self._future.done():
+            return None
+        future, self._future = self._future, None
+        return future.result()  # Repassa uma exceção da evolução para o loop
+
+    def close(self):
+        """Espera a evolução em andamento e encerra a thread"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BackgroundWriter:
+    """Fila de gravações (estatísticas, checkpoints) executadas numa thread.
+
+    `submit` só enfileira a função e os argumentos, que precisam ser cópias
+    (ex.: `ga.checkpoint_state()`, `history.snapshot`): a gravação acontece
+    depois, enquanto o loop segue. Um erro numa gravação é impresso e não
+    derruba o jogo. `close` grava o que falta na fila.
+    """
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='background-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        self._queue.put((fn, args, kwargs))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            fn, args, kwargs = job
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                traceback.print_exc(file=sys.stderr)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,65 @@
+"""O caminho analítico tem que dar exatamente o resultado do motor de criaturas"""
+import copy
+
+import pytest
+
+from config import SCREEN_WIDTH, GROUND_Y
+from genetic import GeneticAlgorithm
+from headless import run_headless
+import simulation
+from simulation import simulate_generation, simulate_generation_analytic
+
+DT = 1 / 60
+APPLES = [(400, 50), (100, 50), (700, 300), (510, 50)]
+
+
+def results(creatures):
+    return [c.score for c in creatures], [c.alive for c in creatures]
+
+
+@pytest.mark.parametrize('n, seed', [(20, 1), (60, 7), (60, 11), (300, 3)])
+@pytest.mark.parametrize('apple', APPLES)
+def test_analytic_matches_creature_engine(n, seed, apple):
+    """Com e sem empilhamento (grupo simulado à parte ou a geração inteira)"""
+    ga = GeneticAlgorithm(population_size=n, seed=seed)
+    creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    analytic = copy.deepcopy(creatures)
+
+    ticks = simulate_generation(creatures, apple, DT)
+
+    assert simulate_generation_analytic(analytic, apple, DT) == ticks
+    assert results(analytic) == results(creatures)
+
+
+@pytest.mark.parametrize('budget', [0.5, 2.0, 15.0])
+def test_analytic_respects_the_budget(budget):
+    ga = GeneticAlgorithm(population_size=50, seed=2)
+    creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    analytic = copy.deepcopy(creatures)
+
+    ticks = simulate_generation(creatures, (300, 50), DT, budget)
+
+    assert simulate_generation_analytic(analytic, (300, 50), DT, budget) == ticks
+    assert results(analytic) == results(creatures)
+
+
+@pytest.mark.parametrize('share', [0, 1])
+@pytest.mark.parametrize('apple', APPLES)
+def test_analytic_group_share(monkeypatch, share, apple):
+    """Passando tudo para a física completa no 1º contato, ou nunca (só o grupo)"""
+    monkeypatch.setattr(simulation, 'FULL_SIMULATION_SHARE', share)
+    ga = GeneticAlgorithm(population_size=60, seed=7)
+    creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    analytic = copy.deepcopy(creatures)
+
+    ticks = simulate_generation(creatures, apple, DT)
+
+    assert simulate_generation_analytic(analytic, apple, DT) == ticks
+    assert results(analytic) == results(creatures)
+
+
+def test_analytic_evolved_generations():
+    """Populações evoluídas se juntam na maçã e se empilham"""
+    creature = run_headless(5, 40, seed=4, engine='creature')
+    analytic = run_headless(5, 40, seed=4, engine='analytic')
+    assert analytic == creature
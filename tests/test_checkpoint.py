@@ -0,0 +1,45 @@
+"""Checkpoint: o arquivo volta igual e retomar dá o mesmo resultado de não parar"""
+import numpy as np
+import pytest
+
+import checkpoint
+from genetic import GeneticAlgorithm
+from headless import run_headless
+
+
+@pytest.mark.parametrize('mmap', [False, True])
+def test_save_load_round_trip(tmp_path, mmap):
+    path = str(tmp_path / 'run.ckpt')
+    genomes = np.random.default_rng(0).random((7, 5))
+    checkpoint.save(path, genomes, 12, [1.5, 3.0], {'seed': 42})
+
+    loaded, generation, history, meta = checkpoint.load(path, mmap=mmap)
+
+    assert np.array_equal(loaded, genomes)
+    assert (generation, history, meta) == (12, [1.5, 3.0], {'seed': 42})
+
+
+def test_ga_state_round_trip(tmp_path):
+    path = str(tmp_path / 'run.ckpt')
+    ga = GeneticAlgorithm(population_size=10, seed=7)
+    ga.evolve(ga.create_population(500, 580), 500, 580)
+    ga.save_checkpoint(path)
+
+    loaded = GeneticAlgorithm.load_checkpoint(path)
+
+    assert (loaded.seed, loaded.generation) == (ga.seed, ga.generation)
+    history, loaded_history = ga.best_fitness_history, loaded.best_fitness_history
+    assert list(loaded_history) == list(history)
+    assert (loaded_history.total, loaded_history.max) == (history.total, history.max)
+    assert np.array_equal(loaded.genomes, ga.genomes)
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    path = str(tmp_path / 'run.ckpt')
+    full = run_headless(4, population_size=30, seed=5, engine='vector')
+
+    run_headless(2, population_size=30, seed=5, engine='vector',
+                 checkpoint_path=path, checkpoint_every=1)
+    resumed = run_headless(2, engine='vector', resume=path)
+
+    assert resumed == full[2:]
@@ -0,0 +1,55 @@
+"""Endpoint de controle: validação dos parâmetros e fila de comandos"""
+import json
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from control import MAX_POPULATION, ControlServer, parse_population, parse_speed
+
+
+@pytest.mark.parametrize('value, speed', [('max', None), ('1', 1), ('2', 2), ('8', 8)])
+def test_parse_speed(value, speed):
+    assert parse_speed(value) == speed
+
+
+@pytest.mark.parametrize('value', ['0', '-2', '3', '0.5', 'inf', '1e308', 'nan', 'rápido', ''])
+def test_parse_speed_rejects(value):
+    with pytest.raises(ValueError):
+        parse_speed(value)
+
+
+def test_parse_population():
+    assert parse_population('200') == 200
+    assert parse_population('5', minimum=5) == 5
+    assert parse_population(str(MAX_POPULATION)) == MAX_POPULATION
+
+
+@pytest.mark.parametrize('value', ['2', '-1', '1.5', 'muitas', str(MAX_POPULATION + 1)])
+def test_parse_population_rejects(value):
+    with pytest.raises(ValueError):
+        parse_population(value)
+
+
+def request(server, path, method='GET'):
+    host, port = server.address
+    try:
+        with urlopen(Request(f'http://{host}:{port}{path}', method=method), timeout=5) as r:
+            return r.status, json.loads(r.read())
+    except HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_server_queues_valid_commands():
+    with ControlServer() as server:
+        server.publish({'generation': 3})
+        assert request(server, '/stats') == (200, {'generation': 3})
+        assert request(server, '/speed?value=8', 'POST') == (202, {'speed': 8})
+        assert request(server, '/population?size=50', 'POST') == (202, {'population': 50})
+        assert request(server, '/speed?value=0', 'POST')[0] == 400
+        assert request(server, '/population', 'POST')[0] == 400
+        assert request(server, '/population?size=1000000', 'POST')[0] == 400
+        assert request(server, '/reset', 'POST')[0] == 404
+
+        assert list(server.commands()) == [('speed', 8), ('population', 50)]
+        assert list(server.commands()) == []
@@ -0,0 +1,63 @@
+"""O cache de fitness tem que dar o mesmo resultado da avaliação sem cache"""
+import copy
+
+from config import SCREEN_WIDTH, GROUND_Y
+from fitness import FitnessCache, simulate_generation_cached
+from genetic import GeneticAlgorithm
+from headless import run_headless
+from simulation import simulate_generation_vectorized
+
+APPLE = (300, 50)
+
+
+def results(creatures):
+    return [(c.score, c.alive) for c in creatures]
+
+
+def test_cached_generation_matches_uncached():
+    ga = GeneticAlgorithm(population_size=40, seed=2)
+    creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    twin = copy.deepcopy(creatures)
+    again = copy.deepcopy(creatures)
+    cache = FitnessCache()
+
+    ticks = simulate_generation_vectorized(creatures, APPLE)
+    assert simulate_generation_cached(twin, APPLE, cache) == ticks
+    assert results(twin) == results(creatures)
+
+    # Segunda vez: tudo vem do cache
+    assert simulate_generation_cached(again, APPLE, cache) == ticks
+    assert results(again) == results(creatures)
+    assert cache.hits == len(creatures)
+
+
+def test_cache_is_keyed_by_environment():
+    ga = GeneticAlgorithm(population_size=10, seed=3)
+    creatures = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    cache = FitnessCache()
+    simulate_generation_cached(copy.deepcopy(creatures), APPLE, cache)
+    simulate_generation_cached(copy.deepcopy(creatures), (700, 50), cache)
+
+    assert cache.hits == 0
+    assert len(cache) == 2 * len(creatures)
+
+
+def test_lru_evicts_the_oldest_entry():
+    cache = FitnessCache(max_items=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+
+
+def test_headless_run_with_cache_matches_uncached():
+    uncached = run_headless(5, population_size=30, seed=9, engine='vector')
+    cached = run_headless(5, population_size=30, seed=9, engine='vector',
+                          fitness_cache=FitnessCache())
+
+    for stats in cached:
+        del stats['cache_hit_rate']
+    assert cached == uncached
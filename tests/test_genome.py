@@ -0,0 +1,74 @@
+"""Operadores em lote do genoma: torneio e mutação"""
+from math import comb
+
+import numpy as np
+import pytest
+
+import genome
+from genome import COLOR, LOWER, UPPER, MUTATION_STEP, N_GENES
+from seeds import spawn_rng
+
+
+def test_tournament_participants_are_distinct():
+    """Com torneios do tamanho da população, todo torneio é ganho pelo melhor"""
+    rng = spawn_rng(0)
+    fitness = rng.permutation(3).astype(float)
+    winners = genome.tournament(fitness, 1000, 3, rng)
+    assert np.all(winners == np.argmax(fitness))
+
+
+def test_tournament_size_is_limited_to_the_population():
+    winners = genome.tournament([0.2, 0.8], 50, 3, spawn_rng(1))
+    assert np.all(winners == 1)
+
+
+def test_tournament_win_rates():
+    """O r-ésimo pior ganha com probabilidade C(r-1, 2) / C(N, 3)"""
+    pool, n = 8, 200_000
+    rng = spawn_rng(2)
+    fitness = rng.permutation(pool).astype(float)
+    winners = genome.tournament(fitness, n, 3, rng)
+
+    wins = np.bincount(winners, minlength=pool) / n
+    expected = [comb(int(rank), 2) / comb(pool, 3) for rank in fitness]
+    assert wins == pytest.approx(expected, abs=0.005)
+
+
+def test_tournament_ties_go_to_the_first_drawn():
+    """Fitness toda igual: o vencedor é o primeiro sorteado, uniforme na população"""
+    wins = np.bincount(genome.tournament(np.ones(5), 100_000, 3, spawn_rng(3)), minlength=5)
+    assert wins / 100_000 == pytest.approx([0.2] * 5, abs=0.01)
+
+
+def middle(n):
+    return np.tile((LOWER + UPPER) / 2, (n, 1))
+
+
+@pytest.mark.parametrize('gaussian', [False, True])
+def test_mutate_without_rate_keeps_genomes(gaussian):
+    genomes = middle(100)
+    assert np.array_equal(genome.mutate(genomes, 0.0, spawn_rng(4), gaussian), genomes)
+
+
+@pytest.mark.parametrize('gaussian', [False, True])
+def test_mutate_stays_in_bounds(gaussian):
+    rng = spawn_rng(5)
+    genomes = LOWER + rng.random((5000, N_GENES)) * (UPPER - LOWER)
+    genomes[:, COLOR] = np.rint(genomes[:, COLOR])
+
+    mutated = genome.mutate(genomes, 1.0, rng, gaussian)
+
+    assert np.all((mutated >= LOWER) & (mutated <= UPPER))
+    assert np.array_equal(mutated[:, COLOR], np.rint(mutated[:, COLOR]))
+
+
+@pytest.mark.parametrize('gaussian, spread', [(False, 1 / np.sqrt(3)), (True, 0.5)])
+def test_mutation_step_distribution(gaussian, spread):
+    """Longe dos limites: passo uniforme em ±MUTATION_STEP ou normal com desvio MUTATION_STEP/2"""
+    genomes = middle(20_000)
+    step = genome.mutate(genomes, 1.0, spawn_rng(6), gaussian) - genomes
+
+    genes = slice(0, 5)
+    assert step[:, genes].std(axis=0) == pytest.approx(MUTATION_STEP[genes] * spread, rel=0.03)
+    if not gaussian:
+        assert np.all(np.abs(step) <= MUTATION_STEP)
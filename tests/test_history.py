@@ -0,0 +1,84 @@
+"""Histórico de gerações: buffer circular e logs em disco"""
+import csv
+
+import numpy as np
+
+from config import GROUND_Y
+from genetic import GeneticAlgorithm
+from history import STAT_COLUMNS, FitnessHistory, HistoryLog, read_genome_log
+from seeds import spawn_rng
+
+
+def test_fitness_history_keeps_the_last_values():
+    history = FitnessHistory(maxlen=4)
+    for value in [3, 9, 1, 4, 2, 5]:
+        history.append(value)
+
+    assert list(history) == [1, 4, 2, 5]
+    assert (history[-1], history[1:3]) == (5, [4, 2])
+    assert (len(history), history.total, history.max) == (4, 6, 9)
+
+
+def generations(n, population_size=6):
+    """(geração, estatísticas, população) de `n` gerações com scores sorteados"""
+    ga = GeneticAlgorithm(population_size=population_size, seed=4)
+    population = ga.create_population(500, GROUND_Y)
+    rng = spawn_rng(4)
+    for generation in range(1, n + 1):
+        for creature in population:
+            creature.score = float(rng.uniform(0, 100))
+        stats = ga.get_statistics(population)
+        stats.update(alive=population_size, ticks=900, apple=(1, 2))
+        yield generation, stats, population
+        population = ga.evolve(population, 500, GROUND_Y)
+
+
+def test_history_log_round_trip(tmp_path):
+    stats_path, genomes_path = tmp_path / 'history.csv', tmp_path / 'genomes.bin'
+    expected = []
+    with HistoryLog(stats_path, genomes_path, flush_every=2) as log:
+        for generation, stats, population in generations(5):
+            log.record(generation, stats, population)
+            expected.append((generation, dict(stats),
+                             np.array([c.score for c in population]),
+                             np.stack([c.dna.data for c in population])))
+
+    with open(stats_path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [tuple(row) for row in rows] == [STAT_COLUMNS] * len(expected)
+    for row, (generation, stats, _, _) in zip(rows, expected):
+        assert int(row['generation']) == generation
+        assert float(row['best']) == stats['best']
+        assert float(row['median']) == stats['median']
+
+    chunks = list(read_genome_log(genomes_path))
+    assert len(chunks) == len(expected)
+    for (generation, scores, genomes), (want_generation, _, want_scores, want_genomes) in zip(
+            chunks, expected):
+        assert generation == want_generation
+        assert np.array_equal(scores, want_scores)
+        assert np.array_equal(genomes, want_genomes)
+
+
+def test_history_log_appends_to_an_existing_file(tmp_path):
+    path = tmp_path / 'history.csv'
+    runs = list(generations(4))
+    for part in (runs[:2], runs[2:]):
+        with HistoryLog(path) as log:
+            for generation, stats, _ in part:
+                log.record(generation, stats)
+
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row['generation']) for row in rows] == [1, 2, 3, 4]
+
+
+def test_genome_log_ignores_a_truncated_chunk(tmp_path):
+    path = tmp_path / 'genomes.bin'
+    with HistoryLog(tmp_path / 'history.csv', path) as log:
+        for generation, stats, population in generations(3):
+            log.record(generation, stats, population)
+    with open(path, 'r+b') as f:
+        f.truncate(path.stat().st_size - 10)
+
+    assert [generation for generation, _, _ in read_genome_log(path)] == [1, 2]
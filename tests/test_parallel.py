@@ -0,0 +1,44 @@
+"""Avaliação em ilhas: o resultado só depende da seed e do número de ilhas"""
+import copy
+
+import numpy as np
+
+from config import SCREEN_WIDTH, GROUND_Y
+from genetic import GeneticAlgorithm
+from parallel import ParallelEvaluator, split_islands
+
+APPLE = (300, 50)
+
+
+def population(seed=8, n=40):
+    ga = GeneticAlgorithm(population_size=n, seed=seed)
+    return ga, ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+
+
+def test_split_islands_keeps_order_and_sizes():
+    chunks = split_islands(list(range(10)), 4)
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]]
+    assert split_islands([1, 2], 8) == [[1], [2]]
+
+
+def test_result_does_not_depend_on_workers():
+    _, serial = population()
+    pooled = copy.deepcopy(serial)
+
+    with ParallelEvaluator(1, 4, seed=8, engine='vector') as evaluator:
+        ticks = evaluator.evaluate(serial, APPLE, 1)
+    with ParallelEvaluator(2, 4, seed=8, engine='vector') as evaluator:
+        assert evaluator.evaluate(pooled, APPLE, 1) == ticks
+
+    assert [(c.score, c.alive) for c in pooled] == [(c.score, c.alive) for c in serial]
+
+
+def test_creatures_keep_their_genome_rows():
+    ga, creatures = population()
+    rows = [c.dna.data for c in creatures]
+
+    with ParallelEvaluator(2, 4, seed=8, engine='vector') as evaluator:
+        evaluator.evaluate(creatures, APPLE, 1)
+
+    assert all(c.dna.data is row for c, row in zip(creatures, rows))
+    assert all(np.shares_memory(c.dna.data, ga.genomes) for c in creatures)
@@ -0,0 +1,48 @@
+"""Profiler: a exportação por geração usa só as amostras daquela geração"""
+import csv
+import json
+
+from profiler import Profiler
+
+
+def run_phase(profiler, name, times):
+    for _ in range(times):
+        with profiler.phase(name):
+            pass
+
+
+def test_each_generation_exports_only_its_own_samples():
+    profiler = Profiler(enabled=True, window=600)
+    run_phase(profiler, 'update', 500)
+    profiler.end_generation(1)
+    run_phase(profiler, 'update', 40)
+    run_phase(profiler, 'evolve', 1)
+    profiler.end_generation(2)
+    profiler.end_generation(3)  # Geração sem amostras não gera linhas
+
+    rows = [(row['generation'], row['phase'], row['count']) for row in profiler.generations]
+    assert rows == [(1, 'update', 500), (2, 'update', 40), (2, 'evolve', 1)]
+    # O overlay continua com a janela móvel
+    assert profiler.summary()['update']['count'] == 540
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler(enabled=False)
+    run_phase(profiler, 'update', 10)
+    profiler.end_generation(1)
+    assert profiler.generations == [] and profiler.summary() == {}
+
+
+def test_export(tmp_path):
+    profiler = Profiler(enabled=True)
+    run_phase(profiler, 'update', 3)
+    profiler.end_generation(1)
+
+    profiler.export(str(tmp_path / 'profile.json'))
+    profiler.export(str(tmp_path / 'profile.csv'))
+
+    with open(tmp_path / 'profile.json') as f:
+        assert json.load(f) == profiler.generations
+    with open(tmp_path / 'profile.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['generation'], row['phase'], row['count']) for row in rows] == [('1', 'update', '3')]
@@ -0,0 +1,64 @@
+"""Renderer: textos e overlays em cache seguem a posição pedida"""
+import os
+
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+pygame = pytest.importorskip('pygame')
+
+from renderer import Renderer  # noqa: E402
+
+
+@pytest.fixture
+def screen():
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((1020, 700))
+    pygame.display.quit()
+
+
+def frame(renderer, draw):
+    renderer.begin()
+    result = draw()
+    renderer.present()
+    return result
+
+
+def test_text_follows_its_position_after_a_resize(screen):
+    renderer = Renderer(screen, [])
+    renders = []
+
+    class Font:
+        def render(self, *args):
+            renders.append(args)
+            return pygame.font.Font(None, 24).render(*args)
+
+    font = Font()
+
+    def instruction(width):
+        return renderer.text('help', font, "P: Pausar", (200, 200, 200), topleft=(width - 300, 10))
+
+    assert frame(renderer, lambda: instruction(1020)).topleft == (720, 10)
+    assert frame(renderer, lambda: instruction(1020)).topleft == (720, 10)
+
+    renderer.set_static(pygame.display.set_mode((1400, 700)), [])
+    assert frame(renderer, lambda: instruction(1400)).topleft == (1100, 10)
+    # Mudar só a posição não renderiza o texto de novo
+    assert len(renders) == 1
+
+
+def test_overlay_follows_its_position(screen):
+    renderer = Renderer(screen, [])
+    renders = []
+
+    def graph(pos, version=1):
+        def render():
+            renders.append(version)
+            return pygame.Surface((300, 150))
+        return renderer.overlay('graph', version, render, pos)
+
+    assert frame(renderer, lambda: graph((700, 525))).topleft == (700, 525)
+    assert frame(renderer, lambda: graph((1080, 525))).topleft == (1080, 525)
+    assert frame(renderer, lambda: graph((1080, 525), version=2)).topleft == (1080, 525)
+    assert renders == [1, 2]
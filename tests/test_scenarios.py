@@ -0,0 +1,43 @@
+"""Vários cenários numa passada só têm que dar o mesmo que avaliar maçã por maçã"""
+import copy
+
+import numpy as np
+import pytest
+
+from config import SCREEN_WIDTH, GROUND_Y
+from genetic import GeneticAlgorithm
+from scenarios import ScenarioEvaluator, scenario_apples
+from simulation import simulate_generation_vectorized
+
+
+def one_by_one(population, apples):
+    """Scores (K x N), vivas (K x N) e ticks avaliando cada maçã separadamente"""
+    scores, alive, ticks = [], [], 0
+    for apple in apples:
+        twin = copy.deepcopy(population)
+        ticks = max(ticks, simulate_generation_vectorized(twin, tuple(apple)))
+        scores.append([c.score for c in twin])
+        alive.append([c.alive for c in twin])
+    return np.array(scores, dtype=np.float64), np.array(alive), ticks
+
+
+@pytest.mark.parametrize('aggregate', ['mean', 'min'])
+def test_aggregate_matches_one_apple_at_a_time(aggregate):
+    ga = GeneticAlgorithm(population_size=25, seed=6)
+    population = ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+    evaluator = ScenarioEvaluator(4, aggregate, seed=ga.seed)
+    scores, alive, ticks = one_by_one(population, evaluator.apples(ga.generation))
+
+    assert evaluator.evaluate(population, ga.generation) == ticks
+
+    expected = scores.mean(axis=0) if aggregate == 'mean' else scores.min(axis=0)
+    assert [c.score for c in population] == pytest.approx(expected.tolist())
+    assert [c.alive for c in population] == alive.all(axis=0).tolist()
+
+
+def test_apples_depend_on_seed_and_generation():
+    apples = scenario_apples(1, 1, 4)
+    assert np.array_equal(apples, scenario_apples(1, 1, 4))
+    assert not np.array_equal(apples, scenario_apples(1, 2, 4))
+    assert not np.array_equal(apples, scenario_apples(2, 1, 4))
+    assert len({x for x, _ in apples}) > 1
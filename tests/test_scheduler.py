@@ -0,0 +1,54 @@
+"""Agenda da avaliação: orçamento e fim antecipado"""
+import copy
+
+import pytest
+
+from config import SCREEN_WIDTH, GROUND_Y
+from genetic import GeneticAlgorithm
+from scheduler import EvaluationScheduler
+from simulation import simulate_generation
+
+APPLE = (510, 50)
+
+
+def population(n=40, seed=3):
+    ga = GeneticAlgorithm(population_size=n, seed=seed)
+    return ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+
+
+def test_budget():
+    scheduler = EvaluationScheduler(budget=1.0, early_stop=False)
+    for _ in range(59):
+        scheduler.tick(1 / 60)
+    assert not scheduler.expired and scheduler.time_left == pytest.approx(1 / 60)
+    scheduler.tick(1 / 60)
+    assert scheduler.expired
+    scheduler.start()
+    assert scheduler.time_left == 1.0
+
+
+def test_without_early_stop_the_population_is_not_scanned(monkeypatch):
+    calls = []
+    settle = EvaluationScheduler.settle
+    monkeypatch.setattr(EvaluationScheduler, 'settle',
+                        lambda self, creatures: calls.append(1) or settle(self, creatures))
+
+    creatures = population()
+    reference = copy.deepcopy(creatures)
+    ticks = simulate_generation(creatures, APPLE,
+                                scheduler=EvaluationScheduler(15, early_stop=False))
+
+    assert calls == []
+    assert ticks == simulate_generation(reference, APPLE, generation_time=15)
+    assert [c.score for c in creatures] == [c.score for c in reference]
+
+
+def test_early_stop_ends_the_generation_once_everyone_settled():
+    creatures = population()
+    reference = copy.deepcopy(creatures)
+    scheduler = EvaluationScheduler(15, patience=30, early_stop=True)
+
+    ticks = simulate_generation(creatures, APPLE, scheduler=scheduler)
+
+    assert ticks < simulate_generation(reference, APPLE, generation_time=15)
+    assert all(c.frozen or not c.alive for c in creatures)
@@ -0,0 +1,55 @@
+"""O índice espacial tem que dar o mesmo empilhamento da varredura de todos os pares"""
+import copy
+
+from components.creature import Creature
+from components.spatial import SpatialIndex
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y
+from genetic import GeneticAlgorithm
+from seeds import spawn_rng
+
+DT = 1 / 60
+
+
+def crowd(n, seed):
+    ga = GeneticAlgorithm(population_size=n, seed=seed)
+    return ga.create_population(SCREEN_WIDTH // 2, GROUND_Y)
+
+
+def test_query_finds_every_close_creature():
+    creatures = crowd(50, seed=1)
+    rng = spawn_rng(1)
+    for creature in creatures:
+        creature.pos.x += rng.uniform(-200, 200)
+    index = SpatialIndex(max_speed=Creature.SPEED)
+    index.rebuild(creatures)
+
+    for creature in creatures:
+        radius = creature.dna['body_size']
+        near = [c for c in creatures if abs(c.pos.x - creature.pos.x) < radius]
+        found = index.query(creature, radius)
+        assert all(c in found for c in near)
+        # Mesma ordem da lista original (desempate do empilhamento)
+        assert found == [c for c in creatures if c in found]
+
+
+def test_stacking_matches_all_pairs_scan():
+    indexed = crowd(40, seed=3)
+    scanned = copy.deepcopy(indexed)
+    index = SpatialIndex(max_speed=Creature.SPEED)
+    apple = (510, 50)
+    stacked = False
+
+    for _ in range(600):
+        index.rebuild(indexed)
+        for creature in indexed:
+            if creature.alive:
+                creature.update(apple, SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, DT, index)
+        for creature in scanned:
+            if creature.alive:
+                creature.update(apple, SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_Y, DT, scanned)
+
+        assert [tuple(c.pos) for c in indexed] == [tuple(c.pos) for c in scanned]
+        stacked = stacked or any(c.standing_on is not None for c in indexed)
+    assert [(c.score, c.alive) for c in indexed] == [(c.score, c.alive) for c in scanned]
+    # O teste só vale se alguém chegou a se empilhar
+    assert stacked
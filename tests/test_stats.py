@@ -0,0 +1,41 @@
+"""As estatísticas incrementais têm que bater com o cálculo direto"""
+import numpy as np
+import pytest
+
+from components.creature import Creature
+from config import GROUND_Y
+from genetic import GeneticAlgorithm
+from seeds import spawn_rng
+from stats import PopulationStats
+
+
+@pytest.mark.parametrize('n', [1, 2, 31, 64])
+def test_two_heap_median_matches_numpy(n):
+    rng = spawn_rng(n)
+    creatures = [Creature(0, GROUND_Y, rng=rng) for _ in range(n)]
+    stats = PopulationStats(creatures)
+
+    for _ in range(2000):
+        creature = creatures[rng.integers(n)]
+        # Repete valores de propósito (empates e score que não muda)
+        creature.score = float(rng.integers(0, 20)) if rng.random() < 0.5 else rng.uniform(0, 20)
+        if rng.random() < 0.05:
+            creature.alive = not creature.alive
+
+        scores = np.array([c.score for c in creatures])
+        assert stats.best == scores.max()
+        assert stats.worst == scores.min()
+        assert stats.median == np.median(scores)
+        assert stats.mean == pytest.approx(scores.mean())
+        assert stats.alive_count == sum(c.alive for c in creatures)
+        assert stats.best_creature is creatures[int(scores.argmax())]
+
+
+def test_statistics_of_a_new_population():
+    ga = GeneticAlgorithm(population_size=5, seed=1)
+    creatures = ga.create_population(500, GROUND_Y)
+    for creature, score in zip(creatures, [4, 1, 3, 2, 10]):
+        creature.score = score
+
+    assert ga.get_statistics(creatures) == {'best': 10, 'worst': 1, 'average': 4, 'median': 3}
+    assert ga.get_best_creature(creatures) is creatures[4]